@@ -1,15 +1,15 @@
 import polars as pl
 from polars import col as c
+from collections import Counter
 from typing import Optional, Union
+import numpy as np
 import networkx as nx
 import graphblas as gb
-from shapely.geometry import LineString, MultiLineString, MultiPoint
-from shapely.ops import nearest_points
+from shapely import STRtree, get_point, to_wkt
+from shapely.geometry import LineString, MultiLineString
 
-from shapely_function import (
-    segment_list_from_multilinestring, shape_list_to_wkt_list, multipoint_from_multilinestring)
-from polars_shapely_function import (
-    get_linestring_boundaries_col, get_multigeometry_from_col, shape_intersect_shape_col)
+from shapely_function import segment_list_from_multilinestring, shape_list_to_wkt_list
+from polars_shapely_function import get_linestring_boundaries_col
 
 from general_function import generate_log
 
@@ -74,6 +74,8 @@ def get_shortest_path_dijkstra_col_from_multisource(
     Get the shortest path between source and target nodes using Dijkstra's algorithm. Targets are stored in a polars columns  
     and return it as a column.
 
+    A single multi-source Dijkstra run gives the paths of every target for which no source has to be removed.
+
     Args:
         nx_graph (nx.Graph): The graph to search.
         source (list): Starting node for the path.
@@ -83,11 +85,15 @@ def get_shortest_path_dijkstra_col_from_multisource(
     Returns:
         pl.Expr: The Polars expression containing lists of shortest path nodes.
     """
-    return (
-        target.map_elements(lambda x:
-            get_shortest_path_dijkstra_from_multisource(target=x, nx_graph=nx_graph, source=source, weight=weight),
-            return_dtype=pl.List(pl.Utf8))
-    )
+    def shortest_path_from_multisource(target: pl.Series) -> pl.Series:
+        source_path: dict = nx.multi_source_dijkstra_path(nx_graph, sources=set(source), weight=weight)
+        return pl.Series(list(map(
+            lambda x: None if x is None 
+            else source_path[x] if (x in source_path) and set(source).isdisjoint(list(x)) 
+            else get_shortest_path_dijkstra_from_multisource(target=x, nx_graph=nx_graph, source=source, weight=weight),
+            target.to_list())), dtype=pl.List(pl.Utf8))
+        
+    return target.map_batches(shortest_path_from_multisource, return_dtype=pl.List(pl.Utf8))
     
 
 
@@ -129,10 +135,24 @@ def get_edge_data_from_node_list(node_list: list, nx_graph: nx.Graph) -> list[di
     Returns:
         list[dict]: The list of dictionaries containing every edge data.
     """
-    return list(map(
-        lambda x: {"u_of_edge": x[0],"v_of_edge": x[1]} | x[2], 
-        nx.subgraph(nx_graph, node_list).edges(data=True)
-    ))
+    # Multigraph adjacency dictionaries hold a {key: data} dictionary per neighbour
+    if nx_graph.is_multigraph():
+        return list(map(
+            lambda x: {"u_of_edge": x[0],"v_of_edge": x[1]} | x[2], 
+            nx.subgraph(nx_graph, node_list).edges(data=True)
+        ))
+    # Walk the adjacency dictionaries directly instead of building a subgraph view
+    adj: dict = nx_graph._adj
+    node_set: dict = dict.fromkeys(filter(lambda x: x in adj, node_list))
+    is_directed: bool = nx_graph.is_directed()
+    seen: set = set()
+    edge_data: list[dict] = []
+    for u in node_set:
+        for v, data in adj[u].items():
+            if (v in node_set) and (is_directed or (v not in seen)):
+                edge_data.append({"u_of_edge": u, "v_of_edge": v} | data)
+        seen.add(u)
+    return edge_data
 
 
 def get_edge_data_from_path(path: list, nx_graph: nx.Graph, data_name: str) -> list[dict]:
@@ -194,11 +214,23 @@ def get_connected_edges_data(nx_graph: nx.Graph) -> pl.DataFrame:
         pl.DataFrame: A Polars DataFrame containing the connected edges with columns `graph_id` , `u_of_edge`, 
         `v_of_edge`, and every edge attribute.
     """
-
-    edge_data = list(map(
-        lambda x: get_edge_data_from_node_list(node_list=x, nx_graph=nx_graph), 
-        nx.connected_components(nx_graph)
-    ))
+    node_set_list: list[set] = list(nx.connected_components(nx_graph))
+    if nx_graph.is_multigraph():
+        # Multigraph adjacency dictionaries hold a {key: data} dictionary per neighbour
+        edge_data: list[list[dict]] = list(map(
+            lambda x: get_edge_data_from_node_list(node_list=x, nx_graph=nx_graph), node_set_list))
+    else:
+        node_graph_id: dict = {}
+        for graph_id, node_set in enumerate(node_set_list):
+            node_graph_id.update(dict.fromkeys(node_set, graph_id))
+        # Single walk over the adjacency dictionaries, each edge goes to the component of its nodes
+        edge_data = [[] for _ in range(len(node_set_list))]
+        seen: set = set()
+        for u, nbrs in nx_graph._adj.items():
+            for v, data in nbrs.items():
+                if v not in seen:
+                    edge_data[node_graph_id[u]].append({"u_of_edge": u, "v_of_edge": v} | data)
+            seen.add(u)
     return pl.DataFrame({"data": edge_data}, strict=False).with_row_index("graph_id").explode("data").unnest("data")
 
 
@@ -239,30 +271,34 @@ def generate_and_connect_segment_from_linestring_list(linestring_list: list[Line
     if nx.is_connected(nx_graph):
         return segment_list  
 
-    connected_edge: pl.DataFrame = get_connected_edges_data(nx_graph=nx_graph)
-
-    graph_connected: list[int] = []
-    for graph_id in connected_edge["graph_id"].unique():
-        if graph_id not in graph_connected:
-            if graph_connected:
-                graph_id_to_check: list[int] = graph_connected
-            else:
-                graph_id_to_check: list[int] = connected_edge.filter(c("graph_id") != graph_id)["graph_id"].unique().to_list()
-                
-            point_to_connect: MultiPoint = multipoint_from_multilinestring(
-                get_multigeometry_from_col(connected_edge.filter(c("graph_id") == graph_id))) # type: ignore
-            point_to_check: MultiPoint = multipoint_from_multilinestring(
-                get_multigeometry_from_col(connected_edge.filter(c("graph_id").is_in(graph_id_to_check))) # type: ignore
-            )
-
-            new_segment_points = nearest_points(point_to_connect, point_to_check)
-                
-            graph_connected.extend(
-                connected_edge
-                .filter(c("geometry").pipe(shape_intersect_shape_col, geometry=MultiPoint(new_segment_points)))
-                ["graph_id"].unique().to_list()
-            )
-            segment_list.append(LineString(new_segment_points))
+    # Nodes are the segment boundaries in WKT format, their points are taken from the segments since parsing the WKT 
+    # back may not give the exact same coordinates
+    boundary_list: np.ndarray = np.concatenate([get_point(segment_list, 0), get_point(segment_list, -1)])
+    boundary_point: dict = dict(zip(to_wkt(boundary_list, rounding_precision=-1), boundary_list))
+    node_graph_id: dict = {}
+    for graph_id, node_set in enumerate(nx.connected_components(nx_graph)):
+        node_graph_id.update(dict.fromkeys(node_set, graph_id))
+    node_point: np.ndarray = np.array(list(map(lambda x: boundary_point[x], node_graph_id.keys())), dtype=object)
+    node_graph: np.ndarray = np.fromiter(node_graph_id.values(), dtype=int)
+
+    graph_connected: np.ndarray = np.zeros(node_graph.max() + 1, dtype=bool)
+    for graph_id in range(len(graph_connected)):
+        if graph_connected[graph_id]:
+            continue
+        if graph_connected.any():
+            is_to_check: np.ndarray = graph_connected[node_graph]
+        else:
+            is_to_check: np.ndarray = node_graph != graph_id
+        point_to_connect: np.ndarray = node_point[node_graph == graph_id]
+        point_to_check_idx: np.ndarray = np.flatnonzero(is_to_check)
+        # Nearest node of the graphs to check for every node of the graph to connect
+        (connect_idx, check_idx), dist = STRtree(node_point[point_to_check_idx]).query_nearest(
+            point_to_connect, all_matches=False, return_distance=True)
+        closest_idx: int = int(np.argmin(dist))
+        nearest_node_idx: int = point_to_check_idx[check_idx[closest_idx]]
+
+        graph_connected[[graph_id, node_graph[nearest_node_idx]]] = True
+        segment_list.append(LineString([point_to_connect[connect_idx[closest_idx]], node_point[nearest_node_idx]]))
     return segment_list
 
 def generate_bfs_tree_with_edge_data(graph: nx.Graph, source):
@@ -384,6 +420,10 @@ def get_shortest_path_between_col(source_col: pl.Expr, target_col: pl.Expr, nx_g
     """
     Get the shortest path between two columns in a NetworkX graph.
 
+    A source shared by several rows is solved with a single source Dijkstra search whose paths are reused for all its 
+    targets. Other rows use a Dijkstra search stopped at the target, which gives the same path when several shortest 
+    paths exist.
+
     Args:
         source_col (pl.Expr): The source column.
         target_col (pl.Expr): The target column.
@@ -392,10 +432,39 @@ def get_shortest_path_between_col(source_col: pl.Expr, target_col: pl.Expr, nx_g
 
     Returns:
         pl.Expr: A Polars expression containing the shortest path.
-    """
+
+    Raises:
+        nx.NodeNotFound: If a source or a target is not in the graph.
+        nx.NetworkXNoPath: If a target cannot be reached from its source.
+    """
+    def shortest_path_between(data: pl.Series) -> pl.Series:
+        source_list: list = data.struct.field("source").to_list()
+        target_list: list = data.struct.field("target").to_list()
+        source_count: Counter = Counter(source_list)
+        source_path: dict = {}
+        path_list: list = []
+        for source, target in zip(source_list, target_list):
+            if (source is None) or (target is None):
+                path_list.append(None)
+                continue
+            # Same errors as `nx.shortest_path` for unknown nodes
+            if source not in nx_graph:
+                raise nx.NodeNotFound(f"Source {source} is not in G")
+            if target not in nx_graph:
+                raise nx.NodeNotFound(f"Target {target} is not in G")
+            if source_count[source] == 1:
+                path_list.append(nx.dijkstra_path(G=nx_graph, source=source, target=target, weight=weight))
+            else:
+                if source not in source_path:
+                    source_path[source] = nx.single_source_dijkstra_path(G=nx_graph, source=source, weight=weight)
+                if target not in source_path[source]:
+                    raise nx.NetworkXNoPath(f"Target {target} cannot be reached from source {source}")
+                path_list.append(source_path[source][target])
+        # Non string node ids are cast to strings
+        return pl.Series(path_list, dtype=pl.List(pl.Utf8), strict=False)
+
     return (
-        pl.struct(source_col.alias("source"), target_col.alias("target")).map_elements(
-            lambda x: nx.shortest_path(G=nx_graph, source=x["source"], target=x["target"], weight=weight),
-            return_dtype=pl.List(pl.Utf8))
+        pl.struct(source_col.alias("source"), target_col.alias("target"))
+        .map_batches(shortest_path_between, return_dtype=pl.List(pl.Utf8))
     )
     
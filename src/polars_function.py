@@ -1,6 +1,8 @@
 import re
 import uuid
 import json
+from hashlib import sha1
+from functools import reduce
 from datetime import timedelta, datetime
 
 from typing import Optional, Union
@@ -9,7 +11,7 @@ import polars as pl
 from polars import col as c
 import numpy as np
 
-from general_function import modify_string, generate_log, generate_uuid
+from general_function import modify_string, generate_log, NAMESPACE_UUID
 
 
 # Global variable
@@ -61,6 +63,9 @@ def generate_uuid_col(
     """
     Generate UUIDs for a column based on a base UUID and an optional added string.
 
+    The UUIDs are the same as the ones given by `generate_uuid` (UUID version 5). Only the SHA-1 digests are computed
+    row by row, the version bits and the formatting are applied on the whole column.
+
     Args:
         col (pl.Expr): The column to generate UUIDs for.
         base_uuid (uuid.UUID, optional): The base UUID for generating the UUIDs.
@@ -69,11 +74,25 @@ def generate_uuid_col(
     Returns:
         pl.Expr: The column with generated UUIDs.
     """
-
-    return (
-        col.cast(pl.Utf8)
-        .map_elements(lambda x: generate_uuid(base_value=x, base_uuid=base_uuid, added_string=added_string), pl.Utf8)
-    )
+    prefix: bytes = (NAMESPACE_UUID if base_uuid is None else base_uuid).bytes + added_string.encode()
+
+    def generate_uuid_batch(value: pl.Series) -> pl.Series:
+        is_not_null: np.ndarray = value.is_not_null().to_numpy()
+        digest: np.ndarray = np.frombuffer(
+            b"".join(map(lambda x: sha1(prefix + x.encode()).digest()[:16], value.drop_nulls().to_list())), 
+            dtype=np.uint8).reshape(-1, 16).copy()
+        # Version 5 and RFC 4122 variant bits
+        digest[:, 6] = (digest[:, 6] & 0x0F) | 0x50
+        digest[:, 8] = (digest[:, 8] & 0x3F) | 0x80
+        hex_str: np.ndarray = np.full(len(value), None, dtype=object)
+        hex_str[is_not_null] = np.frombuffer(digest.tobytes().hex().encode(), dtype="S32").astype(str)
+        hex_series: pl.Series = pl.Series(hex_str, dtype=pl.Utf8)
+        # 8-4-4-4-12 groups, null rows stay null
+        part_list: list[pl.Series] = list(map(
+            lambda x: hex_series.str.slice(*x), [(0, 8), (8, 4), (12, 4), (16, 4), (20, 12)]))
+        return reduce(lambda x, y: x + "-" + y, part_list)
+
+    return col.cast(pl.Utf8).map_batches(generate_uuid_batch, return_dtype=pl.Utf8)
 
 def cast_float(float_str: pl.Expr) -> pl.Expr:
     """
@@ -102,12 +121,16 @@ def cast_boolean(col: pl.Expr) -> pl.Expr:
         "1": True, "true": True , "oui": True, "1.0": True, "0": False, "0.0": False, 
         "false": False, "vrai": True, "non": False, 
         "off": False, "on": True}
-    return col.cast(pl.Utf8).str.to_lowercase().replace_strict(format_str, default=False).cast(pl.Boolean)
+    return col.cast(pl.Utf8).str.to_lowercase().replace_strict(format_str, default=False, return_dtype=pl.Boolean)
 
 def modify_string_col(string_col: pl.Expr, format_str: dict) -> pl.Expr:
     """
     Modify string columns based on a given format dictionary.
 
+    When every pattern is a plain string (no RegEx special character) and every replacement is a string without 
+    escapes, the replacements are chained as literal Polars `str.replace_all` expressions. Otherwise `modify_string` 
+    (Python RegEx) is applied on every row.
+
     Args:
         string_col (pl.Expr): The string column to modify.
         format_str (dict): The format dictionary containing the string modifications.
@@ -115,10 +138,19 @@ def modify_string_col(string_col: pl.Expr, format_str: dict) -> pl.Expr:
     Returns:
         pl.Expr: The modified string column.
     """
-    return (
-        string_col.map_elements(
-            lambda x: modify_string(string=x, format_str=format_str), return_dtype=pl.Utf8, skip_nulls=True)
+    is_literal: bool = (
+        all(map(lambda x: isinstance(x, str) and x != "" and re.search(r"[.^$*+?{}\[\]\\|()]", x) is None, 
+            format_str.keys())) and
+        all(map(lambda x: isinstance(x, str) and "\\" not in x, format_str.values()))
     )
+    if not is_literal:
+        return (
+            string_col.map_elements(
+                lambda x: modify_string(string=x, format_str=format_str), return_dtype=pl.Utf8, skip_nulls=True)
+        )
+    for str_in, str_out in format_str.items():
+        string_col = string_col.str.replace_all(str_in, str_out, literal=True)
+    return string_col
 
 def parse_date(date_str: Optional[str], default_date: datetime) -> datetime:
     """
@@ -189,12 +221,11 @@ def parse_timestamp(
             format_timestamp: str ="%d_%m_%Y %H_%M_%S"
         elif bool(re.match(r"[0-9]{2}_[0-9]{2}_[0-9]{2}\s[0-9]{2}_[0-9]{2}_[0-9]{2}", item)):
             format_timestamp: str ="%d_%m_%y %H_%M_%S"
+        # Dates are parsed directly as midnight timestamps
         elif bool(re.match(r"[0-9]{4}_[0-9]{2}_[0-9]{2}", item)):
-            timestamp_str = timestamp_str + " 00_00_00"
-            format_timestamp: str ="%Y_%m_%d %H_%M_%S"
+            format_timestamp: str ="%Y_%m_%d"
         elif bool(re.match(r"[0-9]{2}_[0-9]{2}_[0-9]{4}", item)):
-            timestamp_str = timestamp_str + " 00_00_00"
-            format_timestamp: str ="%d_%m_%Y %H_%M_%S"
+            format_timestamp: str ="%d_%m_%Y"
         else:
             raise ValueError("Timestamp format not recognized")
     
@@ -241,17 +272,41 @@ def get_meta_data_string(metadata: pl.Expr) -> pl.Expr:
     """
     Convert metadata to a JSON string, excluding keys with None values.
 
+    When every field holds strings, integers or booleans, the JSON strings are built by Polars with the same layout 
+    as `json.dumps`. Otherwise `json.dumps` is called on every row.
+
     Args:
         metadata (pl.Expr): The metadata column.
 
     Returns:
         pl.Expr: The metadata column as JSON strings.
     """
-    return (
-        metadata.map_elements(
-            lambda x: json.dumps({key: value for key, value in x.items() if value is not None}, ensure_ascii=False), 
-        return_dtype=pl.Utf8)
-    ).replace({"{}": None})
+    def get_key_value(idx: int, name: str) -> pl.Expr:
+        # Fields are selected by position as their names could be read as RegEx column selectors. The value is 
+        # encoded by Polars as `{"v":value}` and only the value is kept
+        value: pl.Expr = pl.struct(pl.nth(idx).alias("v")).struct.json_encode().str.slice(5).str.strip_suffix("}")
+        return pl.when(pl.nth(idx).is_not_null()).then(
+            pl.concat_str(pl.lit(json.dumps(name, ensure_ascii=False) + ": "), value))
+
+    def encode_meta_data(metadata: pl.Series) -> pl.Series:
+        if not all(map(
+            lambda x: (x.dtype == pl.Utf8) or (x.dtype == pl.Boolean) or x.dtype.is_integer(), 
+            metadata.dtype.fields)): # type: ignore
+            return metadata.map_elements(
+                lambda x: json.dumps({key: value for key, value in x.items() if value is not None}, ensure_ascii=False), 
+                return_dtype=pl.Utf8)
+        return (
+            metadata.struct.unnest()
+            .select(pl.concat_str(
+                pl.lit("{"),
+                pl.concat_list(list(map(
+                    lambda x: get_key_value(x[0], x[1].name), enumerate(metadata.dtype.fields)))) # type: ignore
+                .list.drop_nulls().list.join(", "),
+                pl.lit("}")))
+            .to_series()
+        )
+
+    return metadata.map_batches(encode_meta_data, return_dtype=pl.Utf8).replace({"{}": None})
 
 
 def digitize_col(col: pl.Expr, min: float, max: float, nb_state: int) -> pl.Expr:
@@ -268,8 +323,11 @@ def digitize_col(col: pl.Expr, min: float, max: float, nb_state: int) -> pl.Expr
         pl.Expr: The digitized column.
     """
     bins = np.linspace(min, max, nb_state + 1)
+    # Right side sorted search gives the same indices as np.digitize
     return (
-        col.map_elements(lambda x: np.digitize(x, bins), return_dtype=pl.Int64)
+        pl.when(col.is_not_null())
+        .then(pl.lit(pl.Series(bins)).search_sorted(col, side="right").cast(pl.Int64))
+        .name.keep()
     )
 
 
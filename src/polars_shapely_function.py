@@ -1,7 +1,17 @@
-from typing import Optional, Union
+"""
+Polars expressions working on geometry columns.
+
+Most functions run vectorized Shapely functions on whole batches (`map_batches`) instead of calling Shapely row by
+row. Shapely releases the GIL inside GEOS, so Polars can process several batches in parallel: prefer running large
+pipelines on a LazyFrame collected with the streaming engine.
+"""
+from typing import Callable, Optional, Union
 from shapely import (
-    LineString, from_wkt, buffer, intersects, union_all, Geometry, extract_unique_points, line_merge, intersection_all)
-from shapely.ops import nearest_points
+    LineString, from_wkt, buffer, intersects, union_all, Geometry, extract_unique_points, line_merge, intersection_all,
+    points, multipoints, linestrings, multilinestrings, to_wkt, centroid, get_parts, get_coordinates, shortest_line,
+    STRtree, is_closed, length, get_geometry, difference, from_wkb, has_z, prepare,
+    to_wkb, multipolygons, force_2d)
+from shapely import transform as sh_transform
 from shapely.geometry import MultiPolygon, Polygon, MultiPoint, Point, LineString, shape, MultiLineString
 import numpy as np
 
@@ -13,13 +23,34 @@ from polars import col as c
 from pyproj import CRS, Transformer
 
 from shapely_function import (
-    shape_to_geoalchemy2, geoalchemy2_to_shape, point_list_to_linestring, shape_coordinate_transformer,
     get_multipoint_from_wkt_list, get_multilinestring_from_wkt_list, get_nearest_point_within_distance,
     move_geometry, linestring_splitter, simplify_linestring, force_linestring_direction, wkt_list_to_shape_list,
-    simplify_multilinestring
+    simplify_multilinestring, POINT_WKT_PATTERN, get_coordinate_transformer
 )
 
 
+def shape_ufunc_col(geometry: pl.Expr, ufunc: Callable, return_dtype: pl.DataType, **kwargs) -> pl.Expr:
+    """
+    Apply a vectorized Shapely function to a column containing geometries, one batch at a time.
+
+    Args:
+        geometry (pl.Expr): The Polars expression containing geometries.
+        ufunc (Callable): The vectorized Shapely function (e.g. `shapely.length`).
+        return_dtype (pl.DataType): The Polars data type returned by the function.
+        **kwargs: Additional arguments given to the function.
+
+    Returns:
+        pl.Expr: A Polars expression with the function results. Null geometries stay null.
+    """
+    def apply_ufunc(geometry: pl.Series) -> pl.Series:
+        result: pl.Series = pl.Series(ufunc(geometry.to_numpy(), **kwargs), dtype=return_dtype)
+        if (return_dtype != pl.Object) and (geometry.null_count() > 0):
+            result = result.scatter(np.flatnonzero(geometry.is_null().to_numpy()), None)
+        return result
+
+    return geometry.map_batches(apply_ufunc, return_dtype=return_dtype)
+
+
 def get_coordinates_list_from_col(df: pl.DataFrame, col_name: str = "geometry") -> list[tuple[float, float]]:
     """
     Extract a list of coordinates from a specified column containing geometric data.
@@ -109,6 +140,132 @@ def get_multilinestring_from_wkt_list_col(linestring_list: pl.Expr) -> pl.Expr:
     """
     return linestring_list.map_elements(get_multilinestring_from_wkt_list, pl.Object)
 
+def flatten_coordinates_list(coord_list: pl.Series) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Flatten a Series containing lists of [x, y] coordinates into a single coordinates array.
+
+    Args:
+        coord_list (pl.Series): The Series containing list of [x, y] coordinates.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The (N, 2) coordinates array and the row index of every coordinate.
+    """
+    lengths: np.ndarray = coord_list.list.len().fill_null(0).to_numpy()
+    coords: np.ndarray = (
+        coord_list.explode(empty_as_null=False).drop_nulls().explode(empty_as_null=False).to_numpy().reshape(-1, 2))
+    return coords, np.repeat(np.arange(len(coord_list)), lengths)
+
+def flatten_wkt_list(wkt_list: pl.Series) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Flatten a Series containing lists of WKT strings into a single array of geometries.
+
+    Args:
+        wkt_list (pl.Series): The Series containing list of WKT strings.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The array of geometries and the row index of every geometry.
+    """
+    wkt_list = wkt_list.list.drop_nulls()
+    lengths: np.ndarray = wkt_list.list.len().fill_null(0).to_numpy()
+    geometries: np.ndarray = from_wkt(wkt_list.explode(empty_as_null=False).drop_nulls().to_numpy())
+    return geometries, np.repeat(np.arange(len(wkt_list)), lengths)
+
+def flatten_point_wkt_list(wkt_list: pl.Series) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Flatten a Series containing lists of WKT points into a single coordinates array.
+
+    `POINT (x y)` strings are decoded with Polars string functions, the GEOS WKT parser is only used when the lists
+    contain other point formats (e.g. with Z coordinates). In this case, Z coordinates are kept if any point has one.
+
+    Args:
+        wkt_list (pl.Series): The Series containing list of WKT points.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The (N, 2) or (N, 3) coordinates array and the row index of every coordinate.
+    """
+    wkt_list = wkt_list.list.drop_nulls()
+    lengths: np.ndarray = wkt_list.list.len().fill_null(0).to_numpy()
+    indices: np.ndarray = np.repeat(np.arange(len(wkt_list)), lengths)
+    point_str: pl.Series = wkt_list.explode(empty_as_null=False).drop_nulls()
+    coords: pl.DataFrame = (
+        point_str.str.extract_groups(POINT_WKT_PATTERN).struct.unnest().select(pl.all().cast(pl.Float64, strict=False))
+    )
+    if coords.null_count().sum_horizontal().item() == 0:
+        return coords.to_numpy(), indices
+    # Empty or multi points do not have exactly one coordinate, so the row index is taken from the parsed point
+    point_shape: np.ndarray = from_wkt(point_str.to_numpy())
+    point_coords, point_idx = get_coordinates(point_shape, include_z=bool(has_z(point_shape).any()), return_index=True)
+    return point_coords, indices[point_idx]
+
+def fill_empty_rows(
+    geometry_list: np.ndarray, list_col: pl.Series, indices: np.ndarray, empty_geometry: Geometry) -> np.ndarray:
+    """
+    Set the geometry of the rows holding an empty list, which are left to None by the vectorized constructors.
+
+    Args:
+        geometry_list (np.ndarray): The array of geometries built for every row (modified in place).
+        list_col (pl.Series): The Series containing the lists used to build the geometries.
+        indices (np.ndarray): The row index of every flattened element of the lists.
+        empty_geometry (Geometry): The empty geometry given to the rows with an empty list.
+
+    Returns:
+        np.ndarray: The array of geometries where only null rows are None.
+    """
+    is_empty: np.ndarray = list_col.is_not_null().to_numpy() & (np.bincount(indices, minlength=len(list_col)) == 0)
+    geometry_list[is_empty] = empty_geometry
+    return geometry_list
+
+def get_multipoint_from_coords_col(coord_list: pl.Expr) -> pl.Expr:
+    """
+    Convert a column containing lists of point coordinates into a MultiPoint geometry.
+
+    Every coordinates of the column are flattened into a single array so that the MultiPoint geometries are built in
+    one vectorized call without any WKT parsing. Use `get_multipoint_from_wkt_list_col` when only WKT points are
+    available.
+
+    Args:
+        coord_list (pl.Expr): The expression representing the column containing list of [x, y] coordinates.
+
+    Returns:
+        pl.Expr: An expression with MultiPoint geometries.
+    """
+    def build_multipoint(coord_list: pl.Series) -> pl.Series:
+        coords, indices = flatten_coordinates_list(coord_list)
+        multipoint_list: np.ndarray = np.full(len(coord_list), None, dtype=object)
+        multipoints(coords, indices=indices, out=multipoint_list)
+        fill_empty_rows(multipoint_list, list_col=coord_list, indices=indices, empty_geometry=MultiPoint())
+        return pl.Series(multipoint_list, dtype=pl.Object)
+
+    return coord_list.map_batches(build_multipoint, return_dtype=pl.Object)
+
+def get_multilinestring_from_coords_col(coord_list: pl.Expr) -> pl.Expr:
+    """
+    Convert a column containing lists of linestring coordinates into a MultiLineString geometry.
+
+    Every coordinates of the column are flattened into a single array so that the MultiLineString geometries are built
+    in one vectorized call without any WKT parsing. Use `get_multilinestring_from_wkt_list_col` when only WKT
+    linestrings are available.
+
+    Args:
+        coord_list (pl.Expr): The expression representing the column containing list of linestring, each one given as a
+        list of [x, y] coordinates.
+
+    Returns:
+        pl.Expr: An expression with MultiLineString geometries.
+    """
+    def build_multilinestring(coord_list: pl.Series) -> pl.Series:
+        line_list: pl.Series = coord_list.explode(empty_as_null=False).drop_nulls()
+        coords, line_indices = flatten_coordinates_list(line_list)
+        row_indices: np.ndarray = np.repeat(
+            np.arange(len(coord_list)), coord_list.list.len().fill_null(0).to_numpy())
+        multilinestring_list: np.ndarray = np.full(len(coord_list), None, dtype=object)
+        multilinestrings(linestrings(coords, indices=line_indices), indices=row_indices, out=multilinestring_list)
+        fill_empty_rows(
+            multilinestring_list, list_col=coord_list, indices=row_indices, empty_geometry=MultiLineString())
+        return pl.Series(multilinestring_list, dtype=pl.Object)
+
+    return coord_list.map_batches(build_multilinestring, return_dtype=pl.Object)
+
 def get_point_list_centroid_col(point_list: pl.Expr) -> pl.Expr:
     """
     Calculate the centroid of a list of points from a specified column containing geometric data.
@@ -133,10 +290,14 @@ def get_point_list_centroid_col(point_list: pl.Expr) -> pl.Expr:
     │ POINT (1 1)    │
     └────────────────┘
     """    
-    return (
-        point_list.pipe(get_multipoint_from_wkt_list_col)
-        .map_elements(lambda x: x.centroid.wkt, return_dtype=pl.Utf8)
-    )
+    def get_centroid(point_list: pl.Series) -> pl.Series:
+        point_shape, indices = flatten_wkt_list(point_list)
+        multipoint_list: np.ndarray = np.full(len(point_list), None, dtype=object)
+        multipoints(point_shape, indices=indices, out=multipoint_list)
+        fill_empty_rows(multipoint_list, list_col=point_list, indices=indices, empty_geometry=MultiPoint())
+        return pl.Series(to_wkt(centroid(multipoint_list), rounding_precision=-1), dtype=pl.Utf8)
+
+    return point_list.map_batches(get_centroid, return_dtype=pl.Utf8)
     
 def get_polygon_centroid_col(polygon: pl.Expr) -> pl.Expr:
     """
@@ -151,7 +312,8 @@ def get_polygon_centroid_col(polygon: pl.Expr) -> pl.Expr:
     """    
     return (
         polygon.pipe(wkt_to_shape_col)
-        .map_elements(lambda x: x.centroid.wkt, return_dtype=pl.Utf8)
+        .pipe(shape_ufunc_col, ufunc=centroid, return_dtype=pl.Object)
+        .pipe(shape_to_wkt_col)
     )
 
 def generate_linestring_from_nearest_points_col(point: pl.Expr, multi_point: MultiPoint):
@@ -184,10 +346,16 @@ def generate_linestring_from_nearest_points_col(point: pl.Expr, multi_point: Mul
     │ POINT (2 2)      ┆ LINESTRING (2 2, 2 1)   │
     └──────────────────┴─────────────────────────┘
     """
-    return (
-        point.pipe(wkt_to_shape_col)
-        .map_elements(lambda x: LineString(nearest_points(x, multi_point)).wkt, return_dtype=pl.Utf8)
-    )
+    point_tree = STRtree(get_parts(multi_point))
+
+    def get_linestring(point: pl.Series) -> pl.Series:
+        point_shape: np.ndarray = point.to_numpy()
+        point_idx, nearest_idx = point_tree.query_nearest(point_shape, all_matches=False)
+        linestring_list: np.ndarray = np.full(len(point), None, dtype=object)
+        linestring_list[point_idx] = shortest_line(point_shape[point_idx], point_tree.geometries[nearest_idx])
+        return pl.Series(to_wkt(linestring_list, rounding_precision=-1), dtype=pl.Utf8)
+
+    return point.pipe(wkt_to_shape_col).map_batches(get_linestring, return_dtype=pl.Utf8)
     
 def linestring_is_ring_col(linestring: pl.Expr) -> pl.Expr:
     """
@@ -219,7 +387,7 @@ def linestring_is_ring_col(linestring: pl.Expr) -> pl.Expr:
     └───────────────────────────────────────┴──────────┘
     """
     
-    return linestring.pipe(wkt_to_shape_col).map_elements(lambda x: x.is_closed, return_dtype=pl.Boolean)
+    return linestring.pipe(wkt_to_shape_col).pipe(shape_ufunc_col, ufunc=is_closed, return_dtype=pl.Boolean)
 
 
 def shape_intersect_shape_col(geo_str: pl.Expr, geometry: Geometry) -> pl.Expr:
@@ -233,7 +401,10 @@ def shape_intersect_shape_col(geo_str: pl.Expr, geometry: Geometry) -> pl.Expr:
     Returns:
         pl.Expr: A Polars expression with boolean values indicating intersection.
     """
-    return geo_str.pipe(wkt_to_shape_col).map_elements(lambda x: intersects(x, geometry), return_dtype=pl.Boolean)
+    # The prepared geometry is only used by GEOS when given as first argument
+    prepare(geometry)
+    return geo_str.pipe(wkt_to_shape_col).pipe(
+        shape_ufunc_col, ufunc=lambda x, b: intersects(b, x), return_dtype=pl.Boolean, b=geometry)
 
 
 def shape_intersect_polygon(geo_str: pl.Expr, polygon: Polygon) -> pl.Expr:
@@ -247,7 +418,7 @@ def shape_intersect_polygon(geo_str: pl.Expr, polygon: Polygon) -> pl.Expr:
     Returns:
         pl.Expr: A Polars expression with boolean values indicating intersection.
     """
-    return geo_str.pipe(wkt_to_shape_col).map_elements(lambda x: intersects(x, polygon), return_dtype=pl.Boolean)
+    return geo_str.pipe(shape_intersect_shape_col, geometry=polygon)
 
 def get_linestring_boundaries_col(line_str: pl.Expr) -> pl.Expr:
     """
@@ -290,13 +461,13 @@ def get_multigeometry_from_col(
     Returns:
         Union[MultiPoint, MultiLineString, MultiPolygon]: The MultiGeometry object.
     """
-    geo_list: list[Union[Point, LineString, Polygon]] = get_geometry_list(df=df, col_name=col_name)
-    if isinstance(geo_list[0], Point):
-        return MultiPoint(geo_list) # type: ignore
-    elif isinstance(geo_list[0], LineString):
-        return MultiLineString(geo_list) # type: ignore
+    geo_array: np.ndarray = np.asarray(get_geometry_list(df=df, col_name=col_name), dtype=object)
+    if isinstance(geo_array[0], Point):
+        return multipoints(geo_array)
+    elif isinstance(geo_array[0], LineString):
+        return multilinestrings(geo_array)
     else:
-        return MultiPolygon(geo_list) # type: ignore
+        return multipolygons(geo_array)
     
 def add_buffer(geo_str: pl.Expr, buffer_size: float) -> pl.Expr:
     """
@@ -309,7 +480,9 @@ def add_buffer(geo_str: pl.Expr, buffer_size: float) -> pl.Expr:
     Returns:
         pl.Expr: A Polars expression with buffered geometries in WKT format.
     """
-    return geo_str.pipe(wkt_to_shape_col).map_elements(lambda x: buffer(x, buffer_size).wkt, return_dtype=pl.Utf8)
+    return geo_str.pipe(wkt_to_shape_col).pipe(
+        shape_ufunc_col, ufunc=lambda x, distance: to_wkt(buffer(x, distance), rounding_precision=-1),
+        return_dtype=pl.Utf8, distance=buffer_size)
 
 
 def calculate_line_length(line_str: pl.Expr) -> pl.Expr:
@@ -322,12 +495,14 @@ def calculate_line_length(line_str: pl.Expr) -> pl.Expr:
     Returns:
         pl.Expr: A Polars expression with the lengths of the LineString geometries.
     """
-    return line_str.pipe(wkt_to_shape_col).map_elements(lambda x: x.length, return_dtype=pl.Float64)
+    return line_str.pipe(wkt_to_shape_col).pipe(shape_ufunc_col, ufunc=length, return_dtype=pl.Float64)
 
 def shape_coordinate_transformer_col(shape_col: pl.Expr, srid_from: int, srid_to: int) -> pl.Expr:
     """
     Transform the coordinates of geometries in a Polars expression from one CRS to another.
 
+    The coordinates of every 2D (and every 3D) geometry of the column are given to PROJ in a single call.
+
     Args:
         shape_col (pl.Expr): The Polars expression containing geometries.
         srid_from (int): The source spatial reference system identifier.
@@ -336,8 +511,19 @@ def shape_coordinate_transformer_col(shape_col: pl.Expr, srid_from: int, srid_to
     Returns:
         pl.Expr: A Polars expression with transformed geometries.
     """
-    return shape_col.map_elements(
-        lambda x: shape_coordinate_transformer(x, srid_from=srid_from, srid_to=srid_to), return_dtype=pl.Object)
+    transformer: Transformer = get_coordinate_transformer(srid_from=srid_from, srid_to=srid_to)
+
+    def transform_coordinates(shape_list: pl.Series) -> pl.Series:
+        shape_array: np.ndarray = shape_list.to_numpy()
+        is_3d: np.ndarray = has_z(shape_array)
+        new_shape: np.ndarray = np.full(len(shape_array), None, dtype=object)
+        for include_z in [False, True]:
+            new_shape[is_3d == include_z] = sh_transform(
+                shape_array[is_3d == include_z], lambda coords: np.column_stack(transformer.transform(*coords.T)),
+                include_z=include_z)
+        return pl.Series(new_shape, dtype=pl.Object)
+
+    return shape_col.map_batches(transform_coordinates, return_dtype=pl.Object)
 
 def generate_point_from_coordinates(x: pl.Expr, y: pl.Expr) -> pl.Expr:
     """
@@ -377,7 +563,19 @@ def get_linestring_from_point_list(point_list_str: pl.Expr) ->  pl.Expr:
     Returns:
         pl.Expr: A Polars expression with LineString geometries in WKT format.
     """
-    return point_list_str.map_elements(point_list_to_linestring, return_dtype=pl.Utf8)
+    def get_linestring(point_list_str: pl.Series) -> pl.Series:
+        coords, indices = flatten_point_wkt_list(point_list_str)
+        linestring_list: np.ndarray = np.full(len(point_list_str), None, dtype=object)
+        linestrings(coords, indices=indices, out=linestring_list)
+        if coords.shape[1] == 3:
+            # Rows without any Z coordinate stay 2D, as if each row was built on its own
+            nb_z: np.ndarray = np.bincount(indices, weights=~np.isnan(coords[:, 2]), minlength=len(point_list_str))
+            is_2d: np.ndarray = nb_z == 0
+            linestring_list[is_2d] = force_2d(linestring_list[is_2d])
+        fill_empty_rows(linestring_list, list_col=point_list_str, indices=indices, empty_geometry=LineString())
+        return pl.Series(to_wkt(linestring_list, rounding_precision=-1), dtype=pl.Utf8)
+
+    return point_list_str.map_batches(get_linestring, return_dtype=pl.Utf8)
 
 def combine_shape(geometry_list_str: pl.Expr) ->  pl.Expr:
     """
@@ -389,7 +587,16 @@ def combine_shape(geometry_list_str: pl.Expr) ->  pl.Expr:
     Returns:
         pl.Expr: A Polars expression with combined geometries in WKT format.
     """
-    return geometry_list_str.map_elements(lambda x: union_all(list(map(from_wkt, x))).wkt, return_dtype=pl.Utf8)
+    def get_union(geometry_list_str: pl.Series) -> pl.Series:
+        geometry_shape, indices = flatten_wkt_list(geometry_list_str)
+        # The flattened geometries are sorted by row, so every row is a slice between consecutive offsets
+        offsets: np.ndarray = np.cumsum(np.bincount(indices, minlength=len(geometry_list_str)))[:-1]
+        union_list: np.ndarray = np.empty(len(geometry_list_str), dtype=object)
+        union_list[:] = list(map(union_all, np.split(geometry_shape, offsets)))
+        union_list[geometry_list_str.is_null().to_numpy()] = None
+        return pl.Series(to_wkt(union_list, rounding_precision=-1), dtype=pl.Utf8)
+
+    return geometry_list_str.map_batches(get_union, return_dtype=pl.Utf8)
 
 
 def shape_to_wkt_col(geometry: pl.Expr) ->  pl.Expr:
@@ -402,19 +609,37 @@ def shape_to_wkt_col(geometry: pl.Expr) ->  pl.Expr:
     Returns:
         pl.Expr: A Polars expression with geometries in WKT format.
     """
-    return geometry.map_elements(lambda x: x.wkt, return_dtype=pl.Utf8)
+    return geometry.map_batches(
+        lambda x: pl.Series(to_wkt(x.to_numpy(), rounding_precision=-1), dtype=pl.Utf8), return_dtype=pl.Utf8)
 
 def wkt_to_shape_col(geometry: pl.Expr) ->  pl.Expr:
     """
     Convert WKT strings in a Polars expression to geometries.
 
+    `POINT (x y)` strings are decoded with Polars string functions and built with a single `shapely.points` call. 
+    Only the other geometries go through the GEOS WKT parser.
+
     Args:
         geometry (pl.Expr): The Polars expression containing WKT strings.
 
     Returns:
         pl.Expr: A Polars expression with geometries.
     """
-    return geometry.map_elements(from_wkt, return_dtype=pl.Object)
+    def wkt_to_shape(geometry: pl.Series) -> pl.Series:
+        geometry = geometry.cast(pl.Utf8)
+        coords: pl.DataFrame = (
+            geometry.str.extract_groups(POINT_WKT_PATTERN).struct.unnest()
+            .select(pl.all().cast(pl.Float64, strict=False))
+        )
+        is_point: np.ndarray = coords.select(pl.all_horizontal(pl.all().is_not_null())).to_series().to_numpy()
+        is_other: np.ndarray = ~is_point & geometry.is_not_null().to_numpy()
+
+        shape_list: np.ndarray = np.full(len(geometry), None, dtype=object)
+        shape_list[is_point] = points(coords.to_numpy()[is_point])
+        shape_list[is_other] = from_wkt(geometry.filter(is_other).to_numpy())
+        return pl.Series(shape_list, dtype=pl.Object)
+
+    return geometry.map_batches(wkt_to_shape, return_dtype=pl.Object)
 
 def geojson_to_wkt_col(geometry: pl.Expr) ->  pl.Expr:
     """
@@ -438,19 +663,26 @@ def shape_to_geoalchemy2_col(geo: pl.Expr) -> pl.Expr:
     Returns:
         pl.Expr: A Polars expression with geometries in GeoAlchemy2 format.
     """
-    return geo.map_elements(shape_to_geoalchemy2, return_dtype=pl.Utf8)
+    return geo.map_batches(
+        lambda x: pl.Series(to_wkb(x.to_numpy(), hex=True, byte_order=1), dtype=pl.Utf8).str.to_lowercase(),
+        return_dtype=pl.Utf8)
 
 def geoalchemy2_to_shape_col(geo_str: pl.Expr) -> pl.Expr:
     """
     Convert GeoAlchemy2 strings in a Polars expression to geometries.
 
+    The hex strings are decoded to binary by Polars and the whole column is parsed with a single `shapely.from_wkb` 
+    call.
+
     Args:
         geo_str (pl.Expr): The Polars expression containing GeoAlchemy2 strings.
 
     Returns:
         pl.Expr: A Polars expression with geometries.
     """
-    return geo_str.map_elements(geoalchemy2_to_shape, return_dtype=pl.Object)
+    return geo_str.map_batches(
+        lambda x: pl.Series(from_wkb(x.cast(pl.Utf8).str.decode("hex").to_numpy()), dtype=pl.Object),
+        return_dtype=pl.Object)
 
 def wkt_to_geoalchemy_col(geo_str: pl.Expr, srid_from: Optional[int], srid_to: Optional[int]) -> pl.Expr:
     """
@@ -467,7 +699,8 @@ def wkt_to_geoalchemy_col(geo_str: pl.Expr, srid_from: Optional[int], srid_to: O
     Raises:
         ValueError: If only one of srid_from or srid_to is provided.
     """
-    if (srid_from is None) and (srid_to is None):
+    # Same SRID (or both None): the coordinates transformation would be an identity
+    if srid_from == srid_to:
         return (
             geo_str.pipe(wkt_to_shape_col)
             .pipe(shape_to_geoalchemy2_col)
@@ -497,7 +730,8 @@ def geoalchemy2_to_wkt_col(geo_str: pl.Expr, srid_from: Optional[int], srid_to:
     Raises:
         ValueError: If only one of srid_from or srid_to is provided.
     """
-    if (srid_from is None) and (srid_to is None):
+    # Same SRID (or both None): the coordinates transformation would be an identity
+    if srid_from == srid_to:
         return (
             geo_str
             .pipe(geoalchemy2_to_shape_col)
@@ -531,7 +765,7 @@ def retrograde_multigeometry(geometry: pl.Expr) -> pl.Expr:
     """
     return (
         geometry.pipe(wkt_to_shape_col)
-            .map_elements(lambda x: x.geoms[0], return_dtype=pl.Object)\
+            .pipe(shape_ufunc_col, ufunc=get_geometry, return_dtype=pl.Object, index=0)\
             .pipe(shape_to_wkt_col)
     )
 
@@ -547,7 +781,7 @@ def merge_linestring_list(geometry: pl.Expr) -> pl.Expr:
     """
     return (
         geometry.pipe(get_multilinestring_from_wkt_list_col)\
-        .map_elements(lambda x: line_merge(line=x), return_dtype=pl.Object)
+        .pipe(shape_ufunc_col, ufunc=line_merge, return_dtype=pl.Object)
         .pipe(shape_to_wkt_col)
     )
     
@@ -580,7 +814,7 @@ def get_geometry_difference(geometry: pl.Expr, diff_geom: Geometry) -> pl.Expr:
     return (
         geometry
         .pipe(wkt_to_shape_col)
-        .map_elements(lambda x: x.difference(diff_geom), return_dtype=pl.Object)
+        .pipe(shape_ufunc_col, ufunc=difference, return_dtype=pl.Object, b=diff_geom)
         .pipe(shape_to_wkt_col)
     )
     
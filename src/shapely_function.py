@@ -2,33 +2,47 @@ from ast import List
 from operator import ge
 import os
 import json
-from itertools import chain
-from copy import deepcopy
+from functools import lru_cache
 
 import re
 from typing import Optional, Union
 from shapely import (
     Geometry, LineString, from_wkt, intersection, distance, buffer, intersects, convex_hull, reverse,
-    extract_unique_points, line_merge, intersection_all, is_simple)
+    extract_unique_points, line_merge, is_simple, get_coordinates, polygons, linearrings, STRtree, force_2d, get_parts,
+    get_point, node, linestrings, to_wkt, is_valid, prepare, box, get_type_id, GeometryType, is_ring, from_wkb, to_wkb)
 from shapely import transform as sh_transform
 
-from shapely.ops import nearest_points, split, snap, linemerge, transform, substring
+from shapely.ops import nearest_points, split, snap, linemerge
 from shapely.geometry import MultiPolygon, Polygon, MultiPoint, Point, LineString, shape, MultiLineString
-from shapely.prepared import prep
 import numpy as np 
 import networkx as nx
 
 
 from pyproj import CRS, Transformer
 
-from geoalchemy2.shape import from_shape, to_shape
-from geoalchemy2.elements import WKBElement
 from math import ceil
 
 SWISS_SRID = 2056
 GPS_SRID = 4326
+POINT_WKT_PATTERN = r"^POINT \(([^\s()]+) ([^\s()]+)\)$"
 
 
+@lru_cache(maxsize=100_000)
+def cached_from_wkt(geometry_str: str) -> Geometry:
+    """
+    Convert a WKT string to a Shapely Geometry object, caching the result of the last parsed strings.
+
+    Shapely geometries are immutable, so the same object can safely be returned for repeated strings (e.g. the same 
+    node used in many rows).
+
+    Args:
+        geometry_str (str): The WKT string.
+
+    Returns:
+        Geometry: The Shapely Geometry object.
+    """
+    return from_wkt(geometry_str)
+
 def get_point_side(line: LineString, point: Point) -> Optional[str]:
     """
     Determine which side of a line a point is on.
@@ -41,14 +55,33 @@ def get_point_side(line: LineString, point: Point) -> Optional[str]:
         str: `start` if the point is to the beginning of the line, 1 if to the right, 
         and `end` if it is at the end.
     """
-    boundaries = list(line.boundary.geoms)
-    if point == boundaries[0]:
+    coords: np.ndarray = get_coordinates(line)
+    point_coords: np.ndarray = get_coordinates(point)[0]
+    if (coords[0] == point_coords).all():
         return "start"
-    elif point == boundaries[1]:
+    elif (coords[-1] == point_coords).all():
         return "end"
     else:
         return None
 
+def get_nearest_coordinate(point: Point, multi_point: MultiPoint) -> tuple[np.ndarray, float]:
+    """
+    Find the coordinates of the nearest point of a MultiPoint using NumPy instead of GEOS.
+
+    Args:
+        point (Point): The reference point.
+        multi_point (MultiPoint): The MultiPoint to search.
+
+    Returns:
+        tuple[np.ndarray, float]: The (x, y) coordinates of the nearest point and its distance to the reference 
+        point.
+    """
+    coords: np.ndarray = get_coordinates(multi_point)
+    squared_distance: np.ndarray = (coords[:, 0] - point.x)**2 + (coords[:, 1] - point.y)**2
+    idx = int(np.argmin(squared_distance))
+    # Same square root of the squared distance as GEOS, so the comparison with a distance threshold is unchanged
+    return coords[idx], float(np.sqrt(squared_distance[idx]))
+
 def get_nearest_point_within_distance(point: Point, point_list: MultiPoint, min_distance: float) -> Optional[str]:
     """
     Find the nearest point within a specified distance from a given point.
@@ -62,6 +95,11 @@ def get_nearest_point_within_distance(point: Point, point_list: MultiPoint, min_
         str or None: The nearest point in wkt format within the specified distance, or None if no 
         point is found.
     """    
+    if isinstance(point, Point) and isinstance(point_list, MultiPoint):
+        nearest_coord, nearest_distance = get_nearest_coordinate(point=point, multi_point=point_list)
+        if nearest_distance < min_distance:
+            return Point(nearest_coord).wkt
+        return None
     nearest_points_list = nearest_points(point_list, point)
     if distance(*nearest_points_list) < min_distance:
         return nearest_points_list[0].wkt
@@ -77,7 +115,11 @@ def get_point_list_centroid(point_list: list[Point]) -> Point:
     Returns:
         Point: The centroid of the list of points.
     """
-    return MultiPoint(point_list).centroid
+    coords: np.ndarray = get_coordinates(np.asarray(point_list, dtype=object))
+    if len(coords) == 0:
+        return Point()
+    # The centroid of points is the mean of their coordinates, no need to build a MultiPoint
+    return Point(coords.mean(axis=0))
 
 def get_multipoint_from_wkt_list(point_list: list[str]) -> MultiPoint:
     """
@@ -89,7 +131,7 @@ def get_multipoint_from_wkt_list(point_list: list[str]) -> MultiPoint:
     Returns:
         MultiPoint: The MultiPoint geometry.
     """
-    return MultiPoint(list(map(from_wkt, point_list))) # type: ignore
+    return MultiPoint(from_wkt(np.asarray(point_list, dtype=object))) # type: ignore
 
 def get_multilinestring_from_wkt_list(linestring_list: list[str]) -> MultiPoint:
     """
@@ -100,7 +142,7 @@ def get_multilinestring_from_wkt_list(linestring_list: list[str]) -> MultiPoint:
     Returns:
         MultiLineString: The MultiLineString geometry.
     """
-    return MultiLineString(list(map(from_wkt, linestring_list))) # type: ignore
+    return MultiLineString(from_wkt(np.asarray(linestring_list, dtype=object)).tolist()) # type: ignore
 
 def get_multipolygon_from_wkt_list(polygon_list: list[str]) -> MultiPolygon:
     """
@@ -112,7 +154,7 @@ def get_multipolygon_from_wkt_list(polygon_list: list[str]) -> MultiPolygon:
     Returns:
         MultiPolygon: The MultiPolygon geometry.
     """
-    return MultiPolygon(list(map(from_wkt, polygon_list))) # type: ignore
+    return MultiPolygon(from_wkt(np.asarray(polygon_list, dtype=object))) # type: ignore
 
 
 def point_list_to_linestring(point_list_str: list[str]) -> str:
@@ -125,9 +167,30 @@ def point_list_to_linestring(point_list_str: list[str]) -> str:
     Returns:
         str: The WKT LineString.
     """
-    return LineString(list(map(from_wkt, point_list_str))).wkt # type: ignore
+    # 2D points are read with a regex, any other WKT goes through GEOS
+    match_list: list = list(map(lambda x: re.match(POINT_WKT_PATTERN, x), point_list_str))
+    if match_list and all(match_list):
+        return to_wkt(
+            linestrings(np.array(list(map(lambda x: x.groups(), match_list)), dtype=float)), rounding_precision=-1)
+    return LineString(from_wkt(np.asarray(point_list_str, dtype=object))).wkt # type: ignore
 
 
+def get_polygon_multipoint_intersection_shape(polygon: Geometry, multipoint: MultiPoint) -> list[Point]:
+    """
+    Get the intersection points between a polygon and a multipoint.
+
+    Args:
+        polygon (Geometry): The polygon.
+        multipoint (MultiPoint): The MultiPoint object.
+
+    Returns:
+        list[Point]: The list of intersection points.
+    """
+    point_shape: Geometry = intersection(polygon, multipoint)
+    if get_type_id(point_shape) in (GeometryType.POINT, GeometryType.MULTIPOINT) and not point_shape.is_empty:
+        return get_parts(point_shape).tolist()
+    return []
+
 def get_polygon_multipoint_intersection(polygon_str: str, multipoint: MultiPoint) -> Optional[list[str]]:
     """
     Get the intersection points between a polygon and a multipoint.
@@ -139,15 +202,8 @@ def get_polygon_multipoint_intersection(polygon_str: str, multipoint: MultiPoint
     Returns:
         Optional[list[str]]: The list of WKT strings representing the intersection points.
     """
-    point_shape: Geometry = intersection(from_wkt(polygon_str), multipoint)
-    
-    if isinstance(point_shape, MultiPoint):
-        return list(map(lambda x: x.wkt, point_shape.geoms))
-    if isinstance(point_shape, Point):
-        if point_shape.is_empty:
-            return []
-        return [point_shape.wkt]
-    return []
+    return shape_list_to_wkt_list(
+        get_polygon_multipoint_intersection_shape(polygon=cached_from_wkt(polygon_str), multipoint=multipoint))
 
 def find_closest_node_from_list(data: dict, node_name: str, node_list_name: str) -> Optional[str]:
     """
@@ -168,9 +224,25 @@ def find_closest_node_from_list(data: dict, node_name: str, node_list_name: str)
     if len(data[node_list_name]) == 1:
         return data[node_list_name][0] 
     if len(data[node_list_name]) > 1:
-        return min(data[node_list_name], key=lambda x: from_wkt(data[node_name]).distance(from_wkt(x)))
+        distance_list: np.ndarray = distance(
+            cached_from_wkt(data[node_name]), from_wkt(np.asarray(data[node_list_name], dtype=object)))
+        return data[node_list_name][int(np.argmin(distance_list))]
     return None
 
+def explode_multipolygon_shape(geometry_shape: Geometry) -> list[Polygon]:
+    """
+    Explode a MultiPolygon into a list of Polygon objects.
+
+    Args:
+        geometry_shape (Geometry): The MultiPolygon.
+
+    Returns:
+        list[Polygon]: The list of Polygon objects.
+    """
+    if get_type_id(geometry_shape) in (GeometryType.POLYGON, GeometryType.MULTIPOLYGON):
+        return get_parts(geometry_shape).tolist()
+    return []
+
 def explode_multipolygon(geometry_str: str) -> list[Polygon]:
     """
     Explode a MultiPolygon WKT string into a list of Polygon objects.
@@ -181,12 +253,7 @@ def explode_multipolygon(geometry_str: str) -> list[Polygon]:
     Returns:
         list[Polygon]: The list of Polygon objects.
     """
-    geometry_shape: Geometry = from_wkt(geometry_str)
-    if isinstance(geometry_shape, Polygon):
-        return [geometry_shape]
-    if isinstance(geometry_shape, MultiPolygon):
-        return list(geometry_shape.geoms)
-    return []
+    return explode_multipolygon_shape(cached_from_wkt(geometry_str))
 
     
 def geoalchemy2_to_shape(geo_str: str) -> Geometry:
@@ -199,7 +266,9 @@ def geoalchemy2_to_shape(geo_str: str) -> Geometry:
     Returns:
         Geometry: The Shapely Geometry object.
     """
-    return to_shape(WKBElement(str(geo_str)))
+    if isinstance(geo_str, (bytes, bytearray)):
+        return from_wkb(geo_str)
+    return from_wkb(str(geo_str))
 
 def shape_to_geoalchemy2(geo: Geometry, srid: int = GPS_SRID) -> str:
     """
@@ -213,7 +282,33 @@ def shape_to_geoalchemy2(geo: Geometry, srid: int = GPS_SRID) -> str:
         str: The GeoAlchemy2 WKBElement string.
     """
     if isinstance(geo, Geometry):
-        return from_shape(geo, srid=srid).desc
+        # Same plain little endian WKB hex as WKBElement.desc (the SRID is not written in the string)
+        return to_wkb(geo, hex=True, byte_order=1).lower()
+    return None
+
+def get_closest_point_from_multi_point_shape(
+    geo: Geometry, multi_point: MultiPoint, max_distance: float=100) -> Optional[Point]:
+    """
+    Find the closest point within a maximum distance from a given geometry.
+
+    Args:
+        geo (Geometry): The geometry.
+        multi_point (MultiPoint): The MultiPoint object.
+        max_distance (float, optional): The maximum distance. Defaults to 100.
+
+    Returns:
+        Optional[Point]: The closest point.
+    """
+    if isinstance(geo, Point) and isinstance(multi_point, MultiPoint):
+        nearest_coord, nearest_distance = get_nearest_coordinate(point=geo, multi_point=multi_point)
+        if nearest_distance < max_distance:
+            return Point(nearest_coord)
+        return None
+    point_list: np.ndarray = get_parts(multi_point)
+    distance_list: np.ndarray = distance(geo, point_list)
+    closest_idx: int = int(np.argmin(distance_list))
+    if distance_list[closest_idx] < max_distance:
+        return point_list[closest_idx]
     return None
 
 def get_closest_point_from_multi_point(geo_str: str, multi_point: MultiPoint, max_distance: float=100) -> Optional[str]:
@@ -228,11 +323,11 @@ def get_closest_point_from_multi_point(geo_str: str, multi_point: MultiPoint, ma
     Returns:
         Optional[str]: The WKT string of the closest point.
     """
-    geo = from_wkt(geo_str)
-    _, closest_point = nearest_points(geo, multi_point)
-    if distance(geo, closest_point) < max_distance:
-        return closest_point.wkt
-    return None
+    closest_point: Optional[Point] = get_closest_point_from_multi_point_shape(
+        geo=cached_from_wkt(geo_str), multi_point=multi_point, max_distance=max_distance)
+    if closest_point is None:
+        return None
+    return closest_point.wkt
     
 def remove_z_coordinates(geom: Geometry)->Geometry:
     """
@@ -244,7 +339,7 @@ def remove_z_coordinates(geom: Geometry)->Geometry:
     Returns:
         Geometry: The Shapely Geometry object without Z coordinates.
     """
-    return transform(lambda x, y, z=None: (x, y), geom)
+    return force_2d(geom)
 
 def get_valid_polygon_str(polygon_str: dict) -> str:
     """
@@ -261,42 +356,130 @@ def get_valid_polygon_str(polygon_str: dict) -> str:
         return polygon.wkt
     return polygon.convex_hull.wkt
 
-def grid_bounds(geom, delta):
+def get_grid_axis(geom: Geometry, delta: float) -> tuple[np.ndarray, np.ndarray]:
     """
-    Generate a grid of polygons within the bounds of a geometry.
+    Get the x and y coordinates of the grid lines covering the bounds of a geometry.
 
     Args:
         geom (Geometry): The Shapely Geometry object.
         delta (float): The grid cell size.
 
     Returns:
-        list[Polygon]: The list of grid polygons.
+        tuple[np.ndarray, np.ndarray]: The x and y coordinates of the grid lines.
     """
     minx, miny, maxx, maxy = geom.bounds
     nx = int(ceil((maxx - minx)/delta)) + 1
     ny = int(ceil((maxy - miny)/delta)) + 1
-    gx, gy = np.linspace(minx,maxx,nx), np.linspace(miny,maxy,ny)
-    grid = []
-    for i in range(len(gx) - 1):
-        for j in range(len(gy) - 1):
-            poly_ij = Polygon([[gx[i],gy[j]],[gx[i],gy[j+1]],[gx[i+1],gy[j+1]],[gx[i+1],gy[j]]])
-            grid.append( poly_ij )
-    return grid
+    return np.linspace(minx,maxx,nx), np.linspace(miny,maxy,ny)
 
-def partition(geom: Polygon, delta: float) -> list:
+def generate_grid_cells(gx: np.ndarray, gy: np.ndarray, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+    """
+    Generate the polygons of the grid cells given by their column and row indices.
+
+    Args:
+        gx (np.ndarray): The x coordinates of the grid lines.
+        gy (np.ndarray): The y coordinates of the grid lines.
+        i (np.ndarray): The column index of every cell.
+        j (np.ndarray): The row index of every cell.
+
+    Returns:
+        np.ndarray: The array of grid polygons.
+    """
+    x0, x1 = gx[i], gx[i + 1]
+    y0, y1 = gy[j], gy[j + 1]
+    # Closed ring of every cell with shape (nb_cell, 5, 2)
+    ring_coords = np.stack([x0, y0, x0, y1, x1, y1, x1, y0, x0, y0], axis=1).reshape(-1, 5, 2)
+    return polygons(linearrings(ring_coords))
+
+def grid_bounds(geom, delta):
+    """
+    Generate a grid of polygons within the bounds of a geometry.
+
+    Args:
+        geom (Geometry): The Shapely Geometry object.
+        delta (float): The grid cell size.
+
+    Returns:
+        list[Polygon]: The list of grid polygons.
+    """
+    gx, gy = get_grid_axis(geom, delta)
+    return generate_all_grid_cells(gx, gy).tolist()
+
+def generate_all_grid_cells(gx: np.ndarray, gy: np.ndarray) -> np.ndarray:
+    """
+    Generate the polygons of every cell of a grid, column by column.
+
+    Args:
+        gx (np.ndarray): The x coordinates of the grid lines.
+        gy (np.ndarray): The y coordinates of the grid lines.
+
+    Returns:
+        np.ndarray: The array of grid polygons.
+    """
+    i, j = np.meshgrid(np.arange(len(gx) - 1), np.arange(len(gy) - 1), indexing="ij")
+    return generate_grid_cells(gx, gy, i.ravel(), j.ravel())
+
+def partition(geom: Polygon, delta: float, block_size: int = 32) -> list:
     """
     Partition a polygon into smaller polygons based on a grid.
 
+    The grid is first split into blocks of `block_size` x `block_size` cells. Cells are only built for the blocks
+    intersecting the polygon, which avoids generating the whole grid for thin or sparse geometries.
+
     Args:
         geom (Polygon): The Shapely Polygon object.
         delta (float): The grid cell size.
+        block_size (int, optional): The number of cells on each side of a block. Defaults to 32.
 
     Returns:
         list[Polygon]: The list of partitioned polygons.
     """
-    prepared_geom = prep(geom)
-    grid = list(filter(prepared_geom.intersects, grid_bounds(geom, delta)))
-    return grid
+    gx, gy = get_grid_axis(geom, delta)
+    nb_x, nb_y = len(gx) - 1, len(gy) - 1
+    prepare(geom)
+    # The grid fits in a single block, pruning would not remove any cell
+    if (nb_x <= block_size) and (nb_y <= block_size):
+        cell_list: np.ndarray = generate_all_grid_cells(gx, gy)
+        return cell_list[intersects(geom, cell_list)].tolist()
+
+    block_i, block_j = np.meshgrid(np.arange(0, nb_x, block_size), np.arange(0, nb_y, block_size), indexing="ij")
+    block_i, block_j = block_i.ravel(), block_j.ravel()
+    block_list: np.ndarray = box(
+        gx[block_i], gy[block_j], gx[np.minimum(block_i + block_size, nb_x)], gy[np.minimum(block_j + block_size, nb_y)])
+    is_kept: np.ndarray = intersects(geom, block_list)
+
+    offset_i, offset_j = np.meshgrid(np.arange(block_size), np.arange(block_size), indexing="ij")
+    i: np.ndarray = (block_i[is_kept][:, None] + offset_i.ravel()).ravel()
+    j: np.ndarray = (block_j[is_kept][:, None] + offset_j.ravel()).ravel()
+    is_in_grid: np.ndarray = (i < nb_x) & (j < nb_y)
+    # Keep the same cell order as grid_bounds
+    cell_order: np.ndarray = np.argsort(i[is_in_grid] * nb_y + j[is_in_grid])
+    cell_list: np.ndarray = generate_grid_cells(gx, gy, i[is_in_grid][cell_order], j[is_in_grid][cell_order])
+    return cell_list[intersects(geom, cell_list)].tolist()
+
+def generate_valid_polygon_shape(shape: Geometry) -> Optional[Union[Polygon, MultiPolygon]]:
+    """
+    Generate a valid polygon from a MultiPolygon.
+
+    Args:
+        shape (Geometry): The MultiPolygon.
+
+    Returns:
+        Optional[Polygon]: The valid polygon.
+    """
+    type_id: int = get_type_id(shape)
+    if type_id == GeometryType.MULTIPOLYGON:
+        polygon_list: np.ndarray = get_parts(shape)
+        is_invalid: np.ndarray = ~is_valid(polygon_list)
+        # Already valid multipolygons are returned as is without being rebuilt
+        if not is_invalid.any():
+            return shape # type: ignore
+        polygon_list[is_invalid] = convex_hull(polygon_list[is_invalid])
+        return MultiPolygon(polygon_list.tolist()) # type: ignore
+    elif type_id == GeometryType.POLYGON:
+        return shape if is_valid(shape) else convex_hull(shape) # type: ignore
+    else:
+        return None
 
 def generate_valid_polygon(multipolygon_str: str) -> Optional[Union[Polygon, MultiPolygon]]:
     """
@@ -308,21 +491,23 @@ def generate_valid_polygon(multipolygon_str: str) -> Optional[Union[Polygon, Mul
     Returns:
         Optional[Polygon]: The valid polygon.
     """
-    shape: Geometry = from_wkt(multipolygon_str)
-    if isinstance(shape, MultiPolygon):
-        return MultiPolygon(list(
-            map(
-                lambda x: x if x.is_valid 
-                else x.convex_hull, 
-                shape.geoms
-            )) # type: ignore
-        )
-    elif isinstance(shape, Polygon):
-        return shape if shape.is_valid else convex_hull(shape) # type: ignore
-    else:
-        return None
+    return generate_valid_polygon_shape(cached_from_wkt(multipolygon_str))
 
 
+@lru_cache(maxsize=64)
+def get_coordinate_transformer(srid_from: int, srid_to: int) -> Transformer:
+    """
+    Get the transformer between two CRS. Transformers are cached as building them is expensive.
+
+    Args:
+        srid_from (int): The source spatial reference system identifier.
+        srid_to (int): The target spatial reference system identifier.
+
+    Returns:
+        Transformer: The transformer from `srid_from` to `srid_to` using the (x, y) axis order.
+    """
+    return Transformer.from_crs(crs_from=CRS(f"EPSG:{srid_from}"), crs_to=CRS(f"EPSG:{srid_to}"), always_xy=True)
+
 def shape_coordinate_transformer(shape: Geometry, srid_from: int, srid_to: int) -> Geometry:
     """
     Transform the coordinates of geometries from one CRS to another.
@@ -335,9 +520,10 @@ def shape_coordinate_transformer(shape: Geometry, srid_from: int, srid_to: int)
     Returns:
         pl.Expr: A Polars expression with transformed geometries.
     """
-    transformer = Transformer.from_crs(
-        crs_from=CRS(f"EPSG:{srid_from}"), crs_to=CRS(f"EPSG:{srid_to}"), always_xy=True).transform
-    return transform(transformer, shape)
+    transformer: Transformer = get_coordinate_transformer(srid_from=srid_from, srid_to=srid_to)
+    # Every coordinates are given to PROJ at once instead of one call per vertex
+    return sh_transform(
+        shape, lambda coords: np.column_stack(transformer.transform(*coords.T)), include_z=shape.has_z)
     
 
 def load_shape_from_geo_json(
@@ -381,8 +567,13 @@ def segment_list_from_multilinestring(multi_linestring: MultiLineString) -> list
     Returns:
         list[LineString]: The list of LineString segments.
     """
-    segments: MultiLineString = intersection(multi_linestring, multi_linestring) # type: ignore
-    return list(segments.geoms)  # type: ignore
+    # Lines are only noded at their crossings, a self-intersection would run a full overlay for the same result
+    coords, line_idx = get_coordinates(
+        get_parts(node(multi_linestring)), include_z=multi_linestring.has_z, return_index=True)
+    # Consecutive coordinates of the same line give one segment, repeated vertices would give zero length segments
+    is_segment: np.ndarray = (
+        (line_idx[:-1] == line_idx[1:]) & np.any(coords[:-1, :2] != coords[1:, :2], axis=1))
+    return linestrings(np.stack([coords[:-1][is_segment], coords[1:][is_segment]], axis=1)).tolist()
 
 def shape_list_to_wkt_list(shape_list: list[Geometry]) -> list[str]:
     """
@@ -394,7 +585,7 @@ def shape_list_to_wkt_list(shape_list: list[Geometry]) -> list[str]:
     Returns:    
         list[str]: The list of WKT strings.
     """
-    return list(map(lambda x: x.wkt, shape_list)) # type: ignore
+    return to_wkt(np.asarray(shape_list, dtype=object), rounding_precision=-1).tolist() # type: ignore
 
 def wkt_list_to_shape_list(str_list: list[str]) -> list[Geometry]:
     """
@@ -406,7 +597,7 @@ def wkt_list_to_shape_list(str_list: list[str]) -> list[Geometry]:
     Returns:    
         list[str]: The list of WKT strings.
     """
-    return list(map(from_wkt, str_list)) # type: ignore
+    return from_wkt(np.asarray(str_list, dtype=object)).tolist() # type: ignore
 
 def multipoint_from_multilinestring(multilinestring: MultiLineString) -> MultiPoint:
     """
@@ -420,13 +611,24 @@ def multipoint_from_multilinestring(multilinestring: MultiLineString) -> MultiPo
     """
     return MultiPoint(extract_unique_points(multilinestring))
 
+def move_geometry_shape(geometry: Geometry, angle: float, distance: float) -> Geometry:
+    """
+    Translate a geometry by a given distance in a given direction.
+
+    Args:
+        geometry (Geometry): The geometry to move.
+        angle (float): The direction of the move in radians (clockwise).
+        distance (float): The distance of the move.
+
+    Returns:
+        Geometry: The moved geometry.
+    """
+    offset: np.ndarray = np.array([np.cos(-angle), np.sin(-angle)])*distance
+    return sh_transform(geometry=geometry, transformation=lambda x: x + offset) # type: ignore
+
 def move_geometry(data: dict) -> str:
-    return (
-        sh_transform(
-            geometry = from_wkt(data["geometry"]),
-            transformation=lambda x: x + np.array([np.cos(-data["angle"]), np.sin(-data["angle"])])*data["distance"], # type: ignore
-        ).wkt
-    )
+    return move_geometry_shape(
+        geometry=cached_from_wkt(data["geometry"]), angle=data["angle"], distance=data["distance"]).wkt
     
 def merge_multilinestring_creating_missing_segments(
     mls: Optional[Union[MultiLineString, LineString]]) -> Optional[LineString]:
@@ -446,26 +648,95 @@ def merge_multilinestring_creating_missing_segments(
         return mls
     if mls is None:
         return None
-    multipoint_list= []
-    for line in mls.geoms:
-            multipoint_list.append(list(line.boundary.geoms))
-    new_segment = []    
-    for i, multipoint in enumerate(multipoint_list): 
-        remaining_list = deepcopy(multipoint_list)
-        remaining_list.pop(i)
-        new_nearest_points = nearest_points(g1=MultiPoint(multipoint), g2=MultiPoint(list(chain(*remaining_list))))
-        new_segment.append(LineString(sorted(LineString(new_nearest_points).coords)))
-        
-    new_linestring = line_merge(MultiLineString(list(mls.geoms) + list(set(new_segment))))
-    # print(new_linestring)
-    if isinstance(new_linestring, MultiLineString):
-        new_linestring= merge_multilinestring_creating_missing_segments(new_linestring)
+    line_list: np.ndarray = get_parts(line_merge(mls))
+    # Both ends of every line, end k belongs to line k // 2
+    end_point: np.ndarray = np.stack([get_point(line_list, 0), get_point(line_list, -1)], axis=1).ravel()
+    end_coords: np.ndarray = get_coordinates(end_point)
+    # Greedy shortest edges between free ends of different components (Kruskal with a union-find) so the
+    # connected lines form a single path. Instead of building every pair of ends, candidate edges are queried in an
+    # STRtree of the free ends for a doubling search radius. Each round only keeps the edges longer than the previous
+    # radius, so edges are still processed in increasing length order.
+    component: np.ndarray = np.arange(len(line_list))
+    def find_root(idx: int) -> int:
+        while component[idx] != idx:
+            component[idx] = component[component[idx]]
+            idx = component[idx]
+        return idx
+    is_free: np.ndarray = np.ones(len(end_coords), dtype=bool)
+    new_segment_list: list[tuple[int, int]] = []
+    nb_union: int = 0
+    span: float = float(np.hypot(*np.ptp(end_coords, axis=0))) if len(end_coords) > 0 else 0.0
+    # The first rounds start at the typical distance between neighbouring ends
+    nearest_distance: np.ndarray = STRtree(end_point).query_nearest(
+        end_point, exclusive=True, return_distance=True, all_matches=False)[1]
+    start_radius: float = float(np.median(nearest_distance)) if len(nearest_distance) > 0 else span
+    min_radius, max_radius = -1.0, 0.0
+    while nb_union < len(line_list) - 1:
+        # The last round covers the whole extent of the ends, so it always connects the remaining components
+        is_last_round: bool = max_radius >= span
+        free_idx: np.ndarray = np.flatnonzero(is_free)
+        free_root: np.ndarray = np.array(list(map(find_root, free_idx // 2)), dtype=int)
+        search_radius: float = 2 * span + 1 if is_last_round else max_radius * (1 + 1e-9)
+        query_idx, tree_idx = STRtree(end_point[free_idx]).query(
+            end_point[free_idx], predicate="dwithin", distance=search_radius)
+        is_candidate: np.ndarray = (query_idx < tree_idx) & (free_root[query_idx] != free_root[tree_idx])
+        end_a, end_b = free_idx[query_idx[is_candidate]], free_idx[tree_idx[is_candidate]]
+        end_distance: np.ndarray = np.hypot(*(end_coords[end_a] - end_coords[end_b]).T)
+        is_candidate = (end_distance > min_radius) & (is_last_round | (end_distance <= max_radius))
+        end_a, end_b, end_distance = end_a[is_candidate], end_b[is_candidate], end_distance[is_candidate]
+        for edge_idx in np.lexsort((end_b, end_a, end_distance)):
+            if nb_union == len(line_list) - 1:
+                break
+            a, b = end_a[edge_idx], end_b[edge_idx]
+            if not (is_free[a] and is_free[b]):
+                continue
+            root_a, root_b = find_root(a // 2), find_root(b // 2)
+            if root_a == root_b:
+                continue
+            component[root_a] = root_b
+            is_free[[a, b]] = False
+            nb_union += 1
+            if end_distance[edge_idx] > 0:
+                new_segment_list.append((a, b))
+        if is_last_round:
+            break
+        min_radius, max_radius = max_radius, max(2 * max_radius, start_radius)
+    new_segment: list = linestrings(end_coords[np.array(new_segment_list, dtype=int).reshape(-1, 2)]).tolist()
+
+    new_linestring = line_merge(MultiLineString(line_list.tolist() + new_segment))
     if isinstance(new_linestring, LineString):
         return new_linestring
     
     raise ValueError("Error in merge_multilinestring_creating_missing_segments")
 
 
+def linestring_splitter_shape(line: LineString, nb_split: int) -> np.ndarray:
+    """
+    Split a LineString into an array of LineString with the same length.
+
+    Args:
+        line (LineString): The LineString to split.
+        nb_split (int): The number of segments to split the LineString into.
+    Returns:
+        np.ndarray: The array of the splitted LineString.
+    """
+    if nb_split < 1:
+        return np.array([], dtype=object)
+    coords: np.ndarray = get_coordinates(line, include_z=line.has_z)
+    segment: np.ndarray = np.diff(coords, axis=0)
+    cum_length: np.ndarray = np.concatenate(([0.0], np.cumsum(np.hypot(segment[:, 0], segment[:, 1]))))
+    split_length: np.ndarray = np.linspace(0, cum_length[-1], nb_split + 1)
+    # The length is measured in 2D, the Z coordinate (if any) is interpolated along it like X and Y
+    split_point: np.ndarray = np.column_stack(
+        list(map(lambda x: np.interp(split_length, cum_length, x), coords.T)))
+    # Vertices strictly inside each sub line
+    first_idx: np.ndarray = np.searchsorted(cum_length, split_length[:-1], side="right")
+    last_idx: np.ndarray = np.searchsorted(cum_length, split_length[1:], side="left")
+    sub_line_coords: list[np.ndarray] = [
+        np.vstack([split_point[i], coords[first_idx[i]:last_idx[i]], split_point[i + 1]]) for i in range(nb_split)]
+    return linestrings(
+        np.concatenate(sub_line_coords), indices=np.repeat(np.arange(nb_split), list(map(len, sub_line_coords))))
+
 def linestring_splitter(linestring_str: Optional[str], nb_split: int) -> Optional[list[str]]:
     """
     Split LineString in WKT format into a list of LineString with the same length.
@@ -478,16 +749,37 @@ def linestring_splitter(linestring_str: Optional[str], nb_split: int) -> Optiona
     """
     if linestring_str is None:
         return None
-    line: Geometry = from_wkt(linestring_str)
+    line: Geometry = cached_from_wkt(linestring_str)
     if not isinstance(line, LineString):
         return None
-    sub_line: list[str] = list(map( 
-            lambda x : 
-            substring(line, start_dist=x*line.length/nb_split, end_dist=(x+1)*line.length/nb_split).wkt, range(nb_split)
-    ))
-    return sub_line
+    return to_wkt(linestring_splitter_shape(line=line, nb_split=nb_split), rounding_precision=-1).tolist()
 
 
+def get_geometry_list_intersection_shape(geometry_list: list[Geometry]) -> Optional[Geometry]:
+    """
+    Get the intersection of a list of geometries.
+    Args:
+        geometry_list (list[Geometry]): The list of geometries.
+    Returns:
+        Optional[Geometry]: The intersection of the geometries.
+    """
+    geometry_array: np.ndarray = np.asarray(geometry_list, dtype=object)
+    if len(geometry_array) == 0:
+        return None
+    # Every geometry has to intersect the first one, otherwise the intersection is empty
+    if len(STRtree(geometry_array).query(geometry_array[0], predicate="intersects")) < len(geometry_array):
+        return None
+    multi_line: Geometry = geometry_array[0]
+    for geometry in geometry_array[1:]:
+        multi_line = intersection(multi_line, geometry)
+        if multi_line.is_empty:
+            return None
+    if isinstance(multi_line, MultiLineString):
+        multi_line = linemerge(multi_line)
+    if multi_line.is_empty:
+        return None
+    return multi_line
+
 def get_geometry_list_intersection(geometry_list: list) -> Optional[str]:
     """
     Get the intersection of a list of geometries in WKT format.
@@ -496,17 +788,28 @@ def get_geometry_list_intersection(geometry_list: list) -> Optional[str]:
     Returns:
         str: The WKT string of the intersection of the geometries.
     """
-    
-    multi_line= get_multilinestring_from_wkt_list(geometry_list)
-    multi_line = intersection_all(multi_line.geoms) # type: ignore
-    if isinstance(multi_line, MultiLineString):
-        multi_line = linemerge(multi_line)
-    if multi_line.is_empty:
+    multi_line: Optional[Geometry] = get_geometry_list_intersection_shape(
+        list(get_multilinestring_from_wkt_list(geometry_list).geoms))
+    if multi_line is None:
         return None
     return multi_line.wkt
 
 
 
+def remove_linestring_circle_from_multilinestring_shape(multi_line: Geometry) -> Geometry:
+    """
+    Remove the circle in the multilinestring and merge results
+    Args:
+        multi_line (Geometry): The geometry
+    Returns:
+        Geometry: The geometry without the circle, unchanged if it is not a MultiLineString
+    """
+    if isinstance(multi_line, MultiLineString):
+        line_list: np.ndarray = get_parts(multi_line)
+        return line_merge(MultiLineString(line_list[~is_ring(line_list)].tolist()))
+    return multi_line
+
+
 def remove_linestring_circle_from_multilinestring(shape_str: str) -> str:
     """
     Remove the circle in the multilinestring and merge results
@@ -520,10 +823,9 @@ def remove_linestring_circle_from_multilinestring(shape_str: str) -> str:
     4. Merge the remaining linestrings using the `line_merge` function.
     5. Return the WKT representation of the merged geometry.
     """
-    multi_line: Geometry = from_wkt(shape_str)
+    multi_line: Geometry = cached_from_wkt(shape_str)
     if isinstance(multi_line, MultiLineString):
-        # print(MultiLineString(list(filter(lambda x: not x.is_ring, multi_line.geoms))))
-        return line_merge(MultiLineString(list(filter(lambda x: not x.is_ring, multi_line.geoms)))).wkt # type: ignore
+        return remove_linestring_circle_from_multilinestring_shape(multi_line).wkt
     else:
         return shape_str
 
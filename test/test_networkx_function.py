@@ -4,18 +4,22 @@ import networkx as nx
 from shapely.geometry import LineString, MultiLineString, Point, MultiPoint
 from networkx_function import (
     generate_nx_edge, get_edge_data_list, get_edge_data_from_node_list,
-    get_connected_edges_data, generate_and_connect_segment_from_linestring_list
+    get_connected_edges_data, generate_and_connect_segment_from_linestring_list, get_shortest_path_between_col,
+    get_shortest_path_dijkstra_col_from_multisource
 )
 
 class TestNetworkxFunctions(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls.base_graph = nx.Graph()
+        cls.base_graph.add_edges_from([
+            ("A", "B", {"length": 1}), ("B", "C", {"length": 2}), ("C", "D", {"length": 1}),
+            ("D", "E", {"length": 2}), ("E", "F", {"length": 1})])
+
     def setUp(self):
-        self.nx_graph = nx.Graph()
-        self.nx_graph.add_edge("A", "B", length=1)
-        self.nx_graph.add_edge("B", "C", length=2)
-        self.nx_graph.add_edge("C", "D", length=1)
-        self.nx_graph.add_edge("D", "E", length=2)
-        self.nx_graph.add_edge("E", "F", length=1)
+        # Some tests add edges, so each one works on its own copy of the shared graph
+        self.nx_graph = self.base_graph.copy()
 
     def test_generate_nx_edge(self):
         df = pl.DataFrame({"u_of_edge": ["X"], "v_of_edge": ["Y"], "length": [3]})
@@ -40,6 +44,60 @@ class TestNetworkxFunctions(unittest.TestCase):
         self.assertEqual(result.shape[0], 5)
         self.assertEqual(result.columns, ["graph_id", "u_of_edge", "v_of_edge", "length"])
 
+    def test_get_edge_data_with_multigraph(self):
+        nx_graph = nx.MultiGraph()
+        nx_graph.add_edges_from([("A", "B", {"length": 1}), ("A", "B", {"length": 2}), ("X", "Y", {"length": 3})])
+        result = get_edge_data_from_node_list(["A", "B"], nx_graph)
+        expected = [
+            {"u_of_edge": "A", "v_of_edge": "B", "length": 1},
+            {"u_of_edge": "A", "v_of_edge": "B", "length": 2}
+        ]
+        self.assertEqual(result, expected)
+        result = get_connected_edges_data(nx_graph)
+        self.assertEqual(result["length"].to_list(), [1, 2, 3])
+        self.assertEqual(result["graph_id"].to_list(), [0, 0, 1])
+
+    def test_get_shortest_path_between_col(self):
+        self.nx_graph.add_edge("A", "F", length=5)
+        df = pl.DataFrame({"source": ["A", "A", "C"], "target": ["F", "C", "F"]})
+        result = df.with_columns(
+            get_shortest_path_between_col(pl.col("source"), pl.col("target"), self.nx_graph, weight="length")
+            .alias("path"))
+        self.assertEqual(
+            result["path"].to_list(), [["A", "F"], ["A", "B", "C"], ["C", "D", "E", "F"]])
+
+    def test_get_shortest_path_between_col_with_integer_nodes(self):
+        df = pl.DataFrame({"source": [0, 0, 4], "target": [3, 1, 2]})
+        result = df.with_columns(
+            get_shortest_path_between_col(pl.col("source"), pl.col("target"), nx.path_graph(5)).alias("path"))
+        self.assertEqual(result["path"].to_list(), [["0", "1", "2", "3"], ["0", "1"], ["4", "3", "2"]])
+
+    def test_get_shortest_path_between_col_with_unknown_node(self):
+        for source in [["A"], ["A", "A"]]:
+            df = pl.DataFrame({"source": source, "target": ["Z", "B"][:len(source)]})
+            with self.assertRaises(nx.NodeNotFound):
+                df.with_columns(
+                    get_shortest_path_between_col(pl.col("source"), pl.col("target"), self.nx_graph).alias("path"))
+
+    def test_get_shortest_path_between_col_with_equal_paths(self):
+        # A-B-C-D-E and A-F-E have the same length, the path must not depend on the other rows
+        self.nx_graph.add_edge("A", "F", length=5)
+        path_list = []
+        for source in [["A"], ["A", "A"]]:
+            df = pl.DataFrame({"source": source, "target": ["E", "C"][:len(source)]})
+            result = df.with_columns(
+                get_shortest_path_between_col(pl.col("source"), pl.col("target"), self.nx_graph, weight="length")
+                .alias("path"))
+            path_list.append(result["path"][0].to_list())
+        self.assertEqual(path_list[0], path_list[1])
+
+    def test_get_shortest_path_dijkstra_col_from_multisource(self):
+        df = pl.DataFrame({"target": ["C", "E", "A", None]})
+        result = df.with_columns(
+            get_shortest_path_dijkstra_col_from_multisource(
+                pl.col("target"), self.nx_graph, source=["A", "F"], weight="length").alias("path"))
+        self.assertEqual(result["path"].to_list(), [["A", "B", "C"], ["F", "E"], ["F", "E", "D", "C", "B", "A"], None])
+
     def test_generate_and_connect_segment_from_linestring_list(self):
         linestring_list = [
             LineString([(0, 0), (1, 1), (2, 2)]),
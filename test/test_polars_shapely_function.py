@@ -1,13 +1,14 @@
 import unittest
 import polars as pl
 from polars import col as c 
-from shapely.geometry import Point, Polygon, MultiPoint, LineString
+from shapely.geometry import Point, Polygon, MultiPoint, LineString, MultiLineString
 from shapely import set_precision
 from polars_shapely_function import (
     shape_intersect_polygon, get_linestring_boundaries_col, get_geometry_list, get_multigeometry_from_col,
     add_buffer, calculate_line_length, shape_coordinate_transformer_col, generate_point_from_coordinates,
-    generate_shape_linestring, get_linestring_from_point_list, combine_shape, shape_to_wkt_col, wkt_to_shape_col,
-    geojson_to_wkt_col, shape_to_geoalchemy2_col, geoalchemy2_to_shape_col, wkt_to_geoalchemy_col, geoalchemy2_to_wkt_col
+    generate_linestring_from_coordinates_list, get_linestring_from_point_list, combine_shape, shape_to_wkt_col, wkt_to_shape_col,
+    geojson_to_wkt_col, shape_to_geoalchemy2_col, geoalchemy2_to_shape_col, wkt_to_geoalchemy_col, geoalchemy2_to_wkt_col,
+    get_multipoint_from_coords_col, get_multilinestring_from_coords_col, get_point_list_centroid_col
 )
 
 class TestPolarsShapelyFunctions(unittest.TestCase):
@@ -34,6 +35,35 @@ class TestPolarsShapelyFunctions(unittest.TestCase):
         self.assertIsInstance(result, MultiPoint)
         self.assertEqual(len(result.geoms), 2)
 
+    def test_get_multipoint_from_coords_col(self):
+        df = pl.DataFrame({"coords": [[[0.0, 0.0], [1.0, 1.0]], None, [[2.0, 2.0]]]})
+        result = df.with_columns(get_multipoint_from_coords_col(pl.col("coords")).alias("multipoint"))
+        self.assertEqual(result["multipoint"].to_list(), [MultiPoint([(0, 0), (1, 1)]), None, MultiPoint([(2, 2)])])
+
+    def test_get_multilinestring_from_coords_col(self):
+        df = pl.DataFrame({"coords": [[[[0.0, 0.0], [1.0, 1.0]], [[2.0, 2.0], [3.0, 3.0]]]]})
+        result = df.with_columns(get_multilinestring_from_coords_col(pl.col("coords")).alias("multilinestring"))
+        self.assertEqual(result["multilinestring"][0], MultiLineString([[(0, 0), (1, 1)], [(2, 2), (3, 3)]]))
+
+    def test_get_multigeometry_from_coords_col_with_empty_list(self):
+        df = pl.DataFrame({"coords": [[[0.0, 0.0]], [], None]})
+        result = df.with_columns(get_multipoint_from_coords_col(pl.col("coords")).alias("multipoint"))
+        self.assertEqual(result["multipoint"].to_list(), [MultiPoint([(0, 0)]), MultiPoint(), None])
+        df = pl.DataFrame({"coords": [[[[0.0, 0.0], [1.0, 1.0]]], [], None]})
+        result = df.with_columns(get_multilinestring_from_coords_col(pl.col("coords")).alias("multilinestring"))
+        self.assertEqual(
+            result["multilinestring"].to_list(), [MultiLineString([[(0, 0), (1, 1)]]), MultiLineString(), None])
+
+    def test_get_point_list_centroid_col(self):
+        df = pl.DataFrame({"points": [["POINT (0 0)", "POINT (1 1)", "POINT (2 2)"], ["POINT (1 2)"]]})
+        result = df.with_columns(get_point_list_centroid_col(pl.col("points")).alias("centroid"))
+        self.assertEqual(result["centroid"].to_list(), ["POINT (1 1)", "POINT (1 2)"])
+
+    def test_get_point_list_centroid_col_with_empty_list(self):
+        df = pl.DataFrame({"points": [["POINT (1 2)"], [], None]})
+        result = df.with_columns(get_point_list_centroid_col(pl.col("points")).alias("centroid"))
+        self.assertEqual(result["centroid"].to_list(), ["POINT (1 2)", "POINT EMPTY", None])
+
     def test_add_buffer(self):
         df = pl.DataFrame({"geometry": ["POINT (1 1)"]})
         result = df.with_columns(add_buffer(pl.col("geometry"), 1.0).alias("buffered"))
@@ -55,9 +85,9 @@ class TestPolarsShapelyFunctions(unittest.TestCase):
         result = df.with_columns(generate_point_from_coordinates(pl.col("x"), pl.col("y")).alias("point"))
         self.assertEqual(result["point"][0], "POINT (1 2)")
 
-    def test_generate_shape_linestring(self):
+    def test_generate_linestring_from_coordinates_list(self):
         df = pl.DataFrame({"coords": [[0, 0, 1, 1, 2, 2]]})
-        result = df.with_columns(generate_shape_linestring(pl.col("coords")).alias("linestring"))
+        result = df.with_columns(generate_linestring_from_coordinates_list(pl.col("coords")).alias("linestring"))
         self.assertEqual(result["linestring"][0], "LINESTRING (0 0, 1 1, 2 2)")
 
     def test_get_linestring_from_point_list(self):
@@ -65,6 +95,13 @@ class TestPolarsShapelyFunctions(unittest.TestCase):
         result = df.with_columns(get_linestring_from_point_list(pl.col("points")).alias("linestring"))
         self.assertEqual(result["linestring"][0], "LINESTRING (0 0, 1 1, 2 2)")
 
+    def test_get_linestring_from_point_list_with_z_and_empty(self):
+        df = pl.DataFrame({"points": [["POINT Z (0 0 1)", "POINT Z (1 1 2)"], ["POINT (0 0)", "POINT (1 1)"], [], None]})
+        result = df.with_columns(get_linestring_from_point_list(pl.col("points")).alias("linestring"))
+        self.assertEqual(
+            result["linestring"].to_list(),
+            ["LINESTRING Z (0 0 1, 1 1 2)", "LINESTRING (0 0, 1 1)", "LINESTRING EMPTY", None])
+
     def test_combine_shape(self):
         df = pl.DataFrame({"geometries": [["POINT (0 0)", "POINT (1 1)"]]})
         result = df.with_columns(combine_shape(pl.col("geometries")).alias("combined"))
@@ -80,6 +117,12 @@ class TestPolarsShapelyFunctions(unittest.TestCase):
         result = df.with_columns(wkt_to_shape_col(pl.col("geometry")).alias("shape"))
         self.assertIsInstance(result["shape"][0], Point)
 
+    def test_wkt_to_shape_col_mixed_geometry(self):
+        df = pl.DataFrame({"geometry": ["POINT (1.5 -2)", None, "LINESTRING (0 0, 1 1)", "POINT Z (1 2 3)"]})
+        result = df.with_columns(wkt_to_shape_col(pl.col("geometry")).alias("shape"))
+        self.assertEqual(
+            result["shape"].to_list(), [Point(1.5, -2), None, LineString([(0, 0), (1, 1)]), Point(1, 2, 3)])
+
     def test_geojson_to_wkt_col(self):
         df = pl.DataFrame({"geometry": [{'type': 'Point', 'coordinates': [1, 1]}]})
         result = df.with_columns(geojson_to_wkt_col(pl.col("geometry")).alias("wkt"))
@@ -96,6 +139,11 @@ class TestPolarsShapelyFunctions(unittest.TestCase):
         self.assertIsInstance(result["shape"][0], Point)
         self.assertEqual(result["shape"][0], Point(1, 2))
 
+    def test_geoalchemy2_to_shape_col_with_null(self):
+        df = pl.DataFrame({"geometry": [None, "0101000000000000000000F03F0000000000000040"]})
+        result = df.with_columns(geoalchemy2_to_shape_col(pl.col("geometry")).alias("shape"))
+        self.assertEqual(result["shape"].to_list(), [None, Point(1, 2)])
+
     def test_wkt_to_geoalchemy_col(self):
         df = pl.DataFrame({"geometry": ["POINT (1 1)"]})
         result = df.with_columns(wkt_to_geoalchemy_col(pl.col("geometry"), 4326, 2056).alias("geoalchemy2"))
@@ -106,5 +154,10 @@ class TestPolarsShapelyFunctions(unittest.TestCase):
         result = df.with_columns(geoalchemy2_to_wkt_col(pl.col("geometry"), 2056, 4326).alias("wkt"))
         self.assertTrue(result["wkt"][0].startswith("POINT (-19.917"))
 
+    def test_geoalchemy2_to_wkt_col_same_srid(self):
+        df = pl.DataFrame({"geometry": ["0101000000000000000000F03F0000000000000040"]})  # WKB for POINT (1 2)
+        result = df.with_columns(geoalchemy2_to_wkt_col(pl.col("geometry"), 2056, 2056).alias("wkt"))
+        self.assertEqual(result["wkt"][0], "POINT (1 2)")
+
 if __name__ == "__main__":
     unittest.main()
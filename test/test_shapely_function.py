@@ -1,10 +1,12 @@
+import math
 import unittest
 from shapely.geometry import Point, Polygon, MultiPoint, MultiPolygon, LineString, MultiLineString
 from shapely_function import (
     point_list_to_linestring, get_polygon_multipoint_intersection, find_closest_node_from_list,
     explode_multipolygon, geoalchemy2_to_shape, shape_to_geoalchemy2, get_closest_point_from_multi_point,
     remove_z_coordinates, get_valid_polygon_str, partition, generate_valid_polygon,
-    shape_list_to_wkt_list, segment_list_from_multilinestring
+    shape_list_to_wkt_list, segment_list_from_multilinestring, merge_multilinestring_creating_missing_segments,
+    linestring_splitter
 )
 
 class TestShapelyFunctions(unittest.TestCase):
@@ -52,6 +54,13 @@ class TestShapelyFunctions(unittest.TestCase):
         result = get_closest_point_from_multi_point(geo_str, multi_point)
         self.assertEqual(result, "POINT (0.5 0.5)")
 
+    def test_get_closest_point_from_multi_point_at_max_distance(self):
+        # The maximum distance is exclusive, exactly as the GEOS distance
+        multi_point = MultiPoint([(1, 1)])
+        self.assertIsNone(get_closest_point_from_multi_point("POINT (0 0)", multi_point, max_distance=math.sqrt(2)))
+        result = get_closest_point_from_multi_point("POINT (0 0)", multi_point, max_distance=math.sqrt(2) + 1e-9)
+        self.assertEqual(result, "POINT (1 1)")
+
     def test_remove_z_coordinates(self):
         point = Point(1, 2, 3)
         result = remove_z_coordinates(point)
@@ -99,5 +108,52 @@ class TestShapelyFunctions(unittest.TestCase):
         ]
         self.assertEqual(result, expected)
 
+    def test_segment_list_from_multilinestring_with_repeated_point(self):
+        multi_linestring = MultiLineString([[(0, 0), (1, 1), (1, 1), (2, 0)]])
+        result = segment_list_from_multilinestring(multi_linestring)
+        self.assertEqual(result, [LineString([(0, 0), (1, 1)]), LineString([(1, 1), (2, 0)])])
+
+    def test_segment_list_from_multilinestring_with_z(self):
+        # Z of a crossing node is computed by the noding, a vertex at the crossing keeps its own Z
+        multi_linestring = MultiLineString([[(0, 0, 0), (2, 2, 2)], [(0, 2, 10), (2, 0, 20)]])
+        result = segment_list_from_multilinestring(multi_linestring)
+        expected = [
+            LineString([(0, 0, 0), (1, 1, 8)]),
+            LineString([(1, 1, 8), (2, 2, 2)]),
+            LineString([(0, 2, 10), (1, 1, 8)]),
+            LineString([(1, 1, 8), (2, 0, 20)])
+        ]
+        self.assertEqual(list(map(lambda x: x.wkt, result)), list(map(lambda x: x.wkt, expected)))
+        multi_linestring = MultiLineString([[(0, 0, 0), (2, 2, 2)], [(0, 2, 10), (1, 1, 4), (2, 0, 20)]])
+        result = segment_list_from_multilinestring(multi_linestring)
+        expected = [
+            LineString([(0, 0, 0), (1, 1, 4)]),
+            LineString([(1, 1, 4), (2, 2, 2)]),
+            LineString([(0, 2, 10), (1, 1, 4)]),
+            LineString([(1, 1, 4), (2, 0, 20)])
+        ]
+        self.assertEqual(list(map(lambda x: x.wkt, result)), list(map(lambda x: x.wkt, expected)))
+
+    def test_merge_multilinestring_creating_missing_segments(self):
+        multi_linestring = MultiLineString([[(0, 0), (1, 0)], [(5, 0), (6, 0)], [(2, 0), (3, 0)], [(3, 0), (4, 0)]])
+        result = merge_multilinestring_creating_missing_segments(multi_linestring)
+        self.assertIsInstance(result, LineString)
+        self.assertTrue(result.equals(LineString([(0, 0), (6, 0)]))) # type: ignore
+        # The far away line is connected to the closest free end of the others
+        multi_linestring = MultiLineString([[(0, 0), (1, 0)], [(2, 0), (3, 0)], [(3, 10), (3, 11)]])
+        result = merge_multilinestring_creating_missing_segments(multi_linestring)
+        self.assertTrue(result.equals(LineString([(0, 0), (3, 0), (3, 11)]))) # type: ignore
+        line = LineString([(0, 0), (1, 1)])
+        self.assertIs(merge_multilinestring_creating_missing_segments(line), line)
+        self.assertIsNone(merge_multilinestring_creating_missing_segments(None))
+
+    def test_linestring_splitter(self):
+        result = linestring_splitter("LINESTRING (0 0, 1 0, 1 2)", 3)
+        self.assertEqual(result, ["LINESTRING (0 0, 1 0)", "LINESTRING (1 0, 1 1)", "LINESTRING (1 1, 1 2)"])
+        result = linestring_splitter("LINESTRING Z (0 0 1, 2 0 3)", 2)
+        self.assertEqual(result, ["LINESTRING Z (0 0 1, 1 0 2)", "LINESTRING Z (1 0 2, 2 0 3)"])
+        self.assertIsNone(linestring_splitter("POINT (0 0)", 2))
+        self.assertIsNone(linestring_splitter(None, 2))
+
 if __name__ == "__main__":
     unittest.main()
@@ -57,6 +57,11 @@ class TestPolarsFunctions(unittest.TestCase):
         result = df.with_columns(get_meta_data_string(pl.col("col")).alias("json_col"))
         self.assertEqual(result["json_col"].to_list(), ['{"key1": "value1"}', '{"key1": "value2", "key2": "value3"}'])
 
+    def test_get_meta_data_string_with_regex_key(self):
+        df = pl.DataFrame({"col": [{"^a.*$": "value1", "ab": "value2"}]})
+        result = df.with_columns(get_meta_data_string(pl.col("col")).alias("json_col"))
+        self.assertEqual(result["json_col"].to_list(), ['{"^a.*$": "value1", "ab": "value2"}'])
+
     def test_digitize_col(self):
         df = pl.DataFrame({"col": [1.0, 2.5, 3.0, 4.5, 5.0]})
         result = df.with_columns(digitize_col(pl.col("col"), 1.0, 5.0, 4).alias("digitized_col"))